@@ -6,7 +6,6 @@
 #
 import logging
 import numpy as np
-import pandas as pd
 import pytest
 from .utils import centered_bins
 
@@ -14,7 +13,16 @@ from .utils import centered_bins
 log = logging.getLogger(__name__)
 
 
-def grid_dataframe(points, vals, xi, export_grid=False):
+def _bin_indices(coords, centers):
+    """Return the index of the bin around `centers` that each of `coords` falls into, and a mask of the
+    coordinates lying inside the outermost bin edges.
+    Bins are right-closed as in :func:`pandas.cut`."""
+    idx = np.searchsorted(centered_bins(centers), coords, side='left')
+    idx -= 1
+    return idx, (idx >= 0) & (idx < len(centers))
+
+
+def grid_dataframe(points, vals, xi, export_grid=False, chunksize=2**20):
     """Bin the values with `points` coordinates by the given target coordinates `xi` and put the average of each bin onto the target grid.
 
     Parameters
@@ -25,10 +33,16 @@ def grid_dataframe(points, vals, xi, export_grid=False):
         The actual data values that are meant to be regridded
     xi : tuple[list, list]
         A tuple `(x, y)` consisting of two lists holding the target coordinates.
+    export_grid : bool
+        If True, return `(xx, yy, target)`. `xx` and `yy` are read-only broadcast views of the target coordinates.
+    chunksize : int
+        Number of points processed at once. Limits the size of the intermediate arrays for large inputs.
 
     Example
     -------
     >>> pytest.skip()
+    >>> import pandas as pd
+    >>> import matplotlib.pyplot as plt
     >>> df = pd.DataFrame({'lon': np.linspace(0, 40, 100),
     >>>                    'lat': np.sin(np.linspace(0, 3, 100))*10 + 40,
     >>>                    'data': np.linspace(240,200,100)})
@@ -47,28 +61,34 @@ def grid_dataframe(points, vals, xi, export_grid=False):
        :alt: example plot
        :align: left
     """
-    x, y = points
-    X, Y = xi
-    xx, yy = np.meshgrid(*xi)
-    target = np.empty(xx.shape) * np.nan
-
-    # flatten target and grid components
-    xx_ = xx.ravel()
-    yy_ = yy.ravel()
-    target_ = target.ravel()
-
-    df = pd.DataFrame({'vals': vals, 'x': x, 'y': y})
-
-    df['x_binned'] = pd.cut(df.x, bins=centered_bins(X), labels=X)
-    df['y_binned'] = pd.cut(df.y, bins=centered_bins(Y), labels=Y)
-
-    df['points'] = df[['x_binned', 'y_binned']].apply(tuple, axis=1)
-
-    df_points_avg = df.groupby('points').mean()
+    x, y = (np.asarray(c, dtype=np.float64) for c in points)
+    vals = np.asarray(vals, dtype=np.float64)
+    X, Y = (np.asarray(c) for c in xi)
+    shape = (len(Y), len(X))
 
-    for idx, row in df_points_avg.iterrows():
-        target_[(xx_ == idx[0]) & (yy_ == idx[1])] = row.vals
+    # stream over the points in chunks, accumulating sums and counts per flat cell index;
+    # the temporaries are bounded by `chunksize`, the accumulators by the number of cells
+    ncells = shape[0] * shape[1]
+    sums = np.zeros(ncells)
+    counts = np.zeros(ncells, dtype=np.intp)
+    for start in range(0, len(vals), chunksize):
+        chunk = slice(start, start + chunksize)
+        ix, x_inside = _bin_indices(x[chunk], X)
+        iy, y_inside = _bin_indices(y[chunk], Y)
+        valid = x_inside & y_inside & ~np.isnan(vals[chunk])
+        # keys stay intp, the index type `np.bincount` works with; narrower ints would only be cast back
+        key = iy[valid]
+        key *= len(X)
+        key += ix[valid]
+        sums += np.bincount(key, weights=vals[chunk][valid], minlength=ncells)
+        counts += np.bincount(key, minlength=ncells)
 
-    target = target_.reshape(xx.shape)
+    with np.errstate(invalid='ignore'):
+        target = (sums / counts).reshape(shape)
 
-    return (xx, yy, target) if export_grid else target
+    if export_grid:
+        # read-only views in place of meshgrid copies
+        xx = np.broadcast_to(X[None, :], shape)
+        yy = np.broadcast_to(Y[:, None], shape)
+        return xx, yy, target
+    return target
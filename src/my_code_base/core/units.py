@@ -7,7 +7,7 @@
 import logging
 import pandas as pd
 import numpy as np
-from copy import copy
+import xarray as xr
 from .utils import order_of_magnitude
 
 
@@ -30,14 +30,14 @@ def pressure2atm(p):
     1    1.010609
     dtype: float64
     """
-    p = copy(p)
-    if 2 <= np.nanmedian(np.rint(order_of_magnitude(p))) <= 3:
-        p /= 1013.25
+    oom = np.nanmedian(np.rint(order_of_magnitude(p)))
+    if 2 <= oom <= 3:
+        p = p / 1013.25
         log.info("Pressure is assumed to be in hPa and was converted to atm")
-    elif 4 <= np.nanmedian(np.rint(order_of_magnitude(p))) <= 5:
-        p /= 101325
+    elif 4 <= oom <= 5:
+        p = p / 101325
         log.info("Pressure is assumed to be in Pa and was converted to atm")
-    elif -1 <= np.nanmedian(np.rint(order_of_magnitude(p))) <= 1:
+    elif -1 <= oom <= 1:
         log.info("Pressure is assumed to be already in atm (no conversion)")
     else:
         raise IOError("Pressure must be given in hPa, Pa or atm")
@@ -60,53 +60,93 @@ def pressure2mbar(p):
     1    2060.95050
     dtype: float64
     """
-    p = copy(p)
-    if 2 <= np.nanmedian(np.rint(order_of_magnitude(p))) <= 3:
+    oom = np.nanmedian(np.rint(order_of_magnitude(p)))
+    if 2 <= oom <= 3:
         log.info("Pressure is assumed to be already in mbar (no conversion)")
-    elif 4 <= np.nanmedian(np.rint(order_of_magnitude(p))) <= 5:
-        p /= 100
+    elif 4 <= oom <= 5:
+        p = p / 100
         log.info("Pressure is assumed to be in Pa and was converted to mbar (hPa)")
-    elif -1 <= np.nanmedian(np.rint(order_of_magnitude(p))) <= 1:
+    elif -1 <= oom <= 1:
         log.info("Pressure is assumed to be in atm and was converted to mbar (hPa)")
-        p *= 1013.25
+        p = p * 1013.25
     else:
         raise IOError("Pressure must be given in hPa, Pa or atm")
     return p
 
 
-def temperature2K(T):
+def temperature2K(T, copy=True):
     """Convert temperatures given in °C into Kelvin.
-    If `T` is a :class:`pandas.Series` object, only values larger than 200 are converted. 
+    If `T` is an array-like object, only values less than 200 are converted. 
     All others are assumed to be already in Kelvin.
 
+    Parameters
+    ----------
+    T : float, numpy.ndarray, pandas.Series or xarray.DataArray
+        The temperature(s) in °C or K.
+    copy : bool
+        If False, a float :class:`numpy.ndarray` is converted in place. A :class:`pandas.Series` is always returned as a new object.
+
     Examples
     --------
     >>> temperature2K(10)
     283.15
+    >>> temperature2K(np.array([10., 283.15]))
+    array([283.15, 283.15])
     """
-    T = copy(T)
-    if isinstance(T, pd.Series):
-        if any(T > 200):
+    if isinstance(T, (pd.Series, np.ndarray)):
+        arr = _float_array(T, copy)
+        if np.any(arr > 200):
             log.warning("Some values seem to be already in Kelvin")
-        T[T < 200] += 273.15
-    elif T < 200:
+        np.add(arr, 273.15, where=arr < 200, out=arr)
+        return _wrap_like(arr, T)
+    if isinstance(T, xr.DataArray):
+        return T.where(~(T < 200), T + 273.15)   # stays lazy for dask-backed data
+    if T < 200:
         T += 273.15
     return T
 
 
-def temperature2C(T):
+def temperature2C(T, copy=True):
     """Convert temperatures given in Kelvin into °C.
-    If `T` is a :class:`pandas.Series` object, only values less than 200 are converted. All others are expected to be
+    If `T` is an array-like object, only values larger than 200 are converted. All others are expected to be
     already in °C.
 
+    Parameters
+    ----------
+    T : float, numpy.ndarray, pandas.Series or xarray.DataArray
+        The temperature(s) in K or °C.
+    copy : bool
+        If False, a float :class:`numpy.ndarray` is converted in place. A :class:`pandas.Series` is always returned as a new object.
+
     Examples
     --------
     >>> temperature2C(283.15)
     10.0
+    >>> temperature2C(pd.Series([283.15, 10.]))
+    0    10.0
+    1    10.0
+    dtype: float64
     """
-    T = copy(T)
-    if isinstance(T, pd.Series):
-        T.loc[T > 200] -= 273.15
-    elif T > 200:
+    if isinstance(T, (pd.Series, np.ndarray)):
+        arr = _float_array(T, copy)
+        np.subtract(arr, 273.15, where=arr > 200, out=arr)
+        return _wrap_like(arr, T)
+    if isinstance(T, xr.DataArray):
+        return T.where(~(T > 200), T - 273.15)   # stays lazy for dask-backed data
+    if T > 200:
         T -= 273.15
     return T
+
+
+def _float_array(x, copy=True):
+    """Return the values of `x` as float :class:`numpy.ndarray`, which can safely be modified in place."""
+    if isinstance(x, pd.Series):
+        return x.to_numpy(dtype=np.float64, copy=True)
+    return np.array(x, dtype=np.float64) if copy else np.asarray(x, dtype=np.float64)
+
+
+def _wrap_like(arr, template):
+    """Wrap `arr` into a :class:`pandas.Series` if `template` is one."""
+    if isinstance(template, pd.Series):
+        return pd.Series(arr, index=template.index, name=template.name)
+    return arr
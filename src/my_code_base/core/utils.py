@@ -32,8 +32,8 @@ def add_metadata(func):
         The decorated function.
     """
     import os
-    import subprocess
     import sys
+    import types
     from pathlib import Path
 
     @functools.wraps(func)
@@ -62,17 +62,71 @@ def add_metadata(func):
         code_filename = frame.f_code.co_filename
         line_number = frame.f_lineno #- 1   # TODO: <-- check!
         relative_code_path = os.path.relpath(code_filename)
-        git_commit = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD']).decode('ascii').strip()
+        git_commit = _git_commit_hash()
 
-        metadata = {}
-        metadata['relative_code_path'] = relative_code_path
-        metadata['line_number'] = str(line_number)
-        metadata['git_commit'] = git_commit
-        return BunchDict(metadata)
+        return types.SimpleNamespace(relative_code_path=relative_code_path,
+                                     line_number=str(line_number),
+                                     git_commit=git_commit)
         
     return wrapper
 
 
+@functools.lru_cache(maxsize=1)
+def _git_commit_hash():
+    """Return the short hash of the current git commit.
+    The hash is read directly from the `.git` directory; only if that fails, a `git` process is spawned.
+    The result is cached for the lifetime of the process."""
+    commit = _read_git_head()
+    if commit is not None:
+        return commit[:7]
+    import subprocess
+    return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD']).decode('ascii').strip()
+
+
+def _read_git_head(path=None):
+    """Resolve `HEAD` of the git repository containing `path` (default: the current working directory)
+    without calling `git`. Returns the full commit hash or `None` if it cannot be determined."""
+    import os
+    import re
+    path = os.path.abspath(path or os.getcwd())
+    while not os.path.exists(os.path.join(path, '.git')):
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+    git_dir = os.path.join(path, '.git')
+    try:
+        if os.path.isfile(git_dir):  # worktrees and submodules: `gitdir: <path>`
+            with open(git_dir) as f:
+                git_dir = os.path.join(path, f.read().strip().removeprefix('gitdir:').strip())
+        with open(os.path.join(git_dir, 'HEAD')) as f:
+            head = f.read().strip()
+        if not head.startswith('ref:'):
+            commit = head
+        else:
+            ref = head.removeprefix('ref:').strip()
+            # refs of linked worktrees live in the common git directory
+            common_dir = git_dir
+            if os.path.isfile(os.path.join(git_dir, 'commondir')):
+                with open(os.path.join(git_dir, 'commondir')) as f:
+                    common_dir = os.path.join(git_dir, f.read().strip())
+            commit = None
+            for d in dict.fromkeys([git_dir, common_dir]):
+                if os.path.isfile(os.path.join(d, ref)):
+                    with open(os.path.join(d, ref)) as f:
+                        commit = f.read().strip()
+                    break
+            if commit is None:
+                with open(os.path.join(common_dir, 'packed-refs')) as f:
+                    for line in f:
+                        if line.rstrip().endswith(' ' + ref):
+                            commit = line.split()[0]
+                            break
+    except OSError:
+        return None
+    return commit if commit and re.fullmatch(r'[0-9a-f]{40,64}', commit) else None
+
+
 class BunchDict(dict):
     """BunchDict is a subclass of the built-in dict class that allows 
     accessing dictionary keys as attributes.
@@ -158,6 +212,7 @@ def save(obj, path, *args, **kwargs):
 
 @save.register(plt.Figure)
 def _(fig, path, *args, **kwargs):
+    kwargs['metadata'] = vars(kwargs['metadata'])  # savefig expects a dict
     plt.savefig(path, *args, **kwargs)
 
 @save.register(pd.DataFrame)
@@ -170,13 +225,14 @@ def _(df, path, *args, **kwargs):
 def _(ds, path, *args, **kwargs):
     from .xarray_utils import HistoryAccessor
     metadata = kwargs.pop('metadata')
-    msg = f"File saved by {metadata['relative_code_path']}#{metadata['line_number']} @git-commit:{metadata['git_commit']}"
+    msg = f"File saved by {metadata.relative_code_path}#{metadata.line_number} @git-commit:{metadata.git_commit}"
     ds = ds.history.add(msg)
     ds.to_netcdf(path, *args, **kwargs)
 
 
 def centered_bins(x):
     """Create centered bin boundaries from a given array with the values of the array as centers.
+    Inner boundaries lie halfway between neighbouring values, the outer ones are extrapolated by half a step.
 
     Example
     -------
@@ -186,15 +242,12 @@ def centered_bins(x):
     >>> centered_bins(x)
     array([-3.5, -2.5, -1.5, -0.5,  0.5,  1.5,  2.5,  3.5])
     """
-    x = np.array(x)
-    x = np.append(x, x[-1] + np.diff(x[-2:]))
-
-    differences = np.gradient(x, 2)
+    x = np.asarray(x, dtype=np.float64)
+    midpoints = 0.5 * (x[:-1] + x[1:])
+    return np.concatenate(([x[0] - (x[1] - x[0]) / 2], midpoints, [x[-1] + (x[-1] - x[-2]) / 2]))
 
-    return x - differences
 
-
-def find_nearest(items: list | np.ndarray, pivot: float) -> float:
+def find_nearest(items: list | np.ndarray, pivot: float, assume_sorted: bool = False) -> float:
     """
     Find the element inside `items` that is closest to the `pivot` element.
 
@@ -204,6 +257,9 @@ def find_nearest(items: list | np.ndarray, pivot: float) -> float:
         A list of elements to search from.
     pivot: 
         The pivot element to find the closest element to.
+    assume_sorted:
+        If True and `items` is a :class:`numpy.ndarray` sorted in ascending order,
+        the closest element is found by bisection instead of a full scan.
 
     Returns
     -------
@@ -215,12 +271,25 @@ def find_nearest(items: list | np.ndarray, pivot: float) -> float:
     >>> result = find_nearest(np.array([2,4,5,7,9,10]), 4.6)
     >>> int(result)      # Cast to int for consistent comparison
     5
+    >>> int(find_nearest(np.array([2,4,5,7,9,10]), 8.2, assume_sorted=True))
+    9
+    >>> find_nearest([2, 4, 5, 7, 9, 10], 4.6)
+    5
     """
-    return min(items, key=lambda x: abs(x - pivot))
+    if not isinstance(items, np.ndarray):
+        return min(items, key=lambda x: abs(x - pivot))
+
+    if assume_sorted and items.size > 1:
+        idx = min(max(np.searchsorted(items, pivot), 1), items.size - 1)
+        left, right = items[idx - 1], items[idx]
+        return left if abs(pivot - left) <= abs(right - pivot) else right
+
+    return items[np.abs(items - pivot).argmin()]
 
 
 def order_of_magnitude(x: int | float | np.ndarray | pd.Series) -> np.ndarray:
     """Determine the order of magnitude of the numeric input.
+    The shape of the input is preserved; zeros have no order of magnitude and yield NaN.
 
     Examples
     --------
@@ -236,11 +305,9 @@ def order_of_magnitude(x: int | float | np.ndarray | pd.Series) -> np.ndarray:
     array([1., 2.])
     >>> order_of_magnitude(pd.Series([24.13, 254.2]))
     array([1., 2.])
+    >>> order_of_magnitude(np.array([-24.13, 0, 254.2]))
+    array([ 1., nan,  2.])
     """
-    x = np.asarray(x)
-    if np.all(x == 0):
-        return None
-    x = x[x != 0]
-    oom = np.floor(np.log10(x))
-    # oom = (np.int32(np.log10(np.abs(x))) + 1)
-    return np.array(oom)
+    x = np.abs(np.atleast_1d(np.asarray(x, dtype=np.float64)))
+    oom = np.log10(x, where=x != 0, out=np.full_like(x, np.nan))
+    return np.floor(oom, out=oom)
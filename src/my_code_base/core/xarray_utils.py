@@ -25,6 +25,7 @@ class HistoryAccessor:
             The xarray object to be accessed.
         """
         self._obj = xr_obj
+        self._pending = []
         self._ensure_history()
 
     def _ensure_history(self):
@@ -32,10 +33,9 @@ class HistoryAccessor:
         Ensure that the 'history' attribute exists in the xarray object.
         If it doesn't exist, create an empty 'history' attribute.
         """
-        if 'history' not in self._obj.attrs.keys():
-            self._obj.attrs['history'] = ""
+        self._obj.attrs.setdefault('history', "")
 
-    def add(self, msg):
+    def add(self, msg, flush=True):
         """
         Add an entry to the history.
 
@@ -43,6 +43,10 @@ class HistoryAccessor:
         ----------
         msg: str
             The message to be added to the history.
+        flush: bool
+            If False, only buffer the entry; buffered entries are written to the 'history' attribute in one go
+            by the next call to :meth:`flush` (or to :meth:`add` with `flush=True`).
+            Use this when adding many entries in a loop.
 
         Example
         -------
@@ -50,34 +54,112 @@ class HistoryAccessor:
         >>> da.attrs['history']                           # doctest: +SKIP
         '...: New entry to history; '
         """
+        if not msg:
+            return self._obj
         from datetime import datetime
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self._obj.attrs['history'] += f"{timestamp}: {msg}; "
+        self._pending.append(f"{timestamp}: {msg}; ")
         log.debug("Wrote '%s' to history", msg)
+        if flush:
+            self.flush()
+        return self._obj
+
+    @property
+    def text(self):
+        """
+        The full history, including entries that are still buffered, without writing them to the attribute.
+        """
+        return self._obj.attrs.get('history', "") + "".join(self._pending)
+
+    def flush(self):
+        """
+        Write all buffered entries to the 'history' attribute.
+        Call this before writing the object to disk if entries were added with `flush=False`.
+        """
+        if self._pending:
+            self._ensure_history()
+            self._obj.attrs['history'] += "".join(self._pending)
+            self._pending.clear()
         return self._obj
     
 
-def compress_xarray(data: xr.Dataset | xr.DataArray, complevel: int) -> xr.Dataset | xr.DataArray:
+_COMPRESSION_ALGORITHMS = ('zlib', 'zstd', 'bzip2', 'szip', 'blosc_lz', 'blosc_lz4', 'blosc_lz4hc', 'blosc_zlib',
+                           'blosc_zstd')
+
+
+def _compression_settings(complevel: int, algorithm: str) -> dict:
+    """Return the per-variable `encoding` entries for the given compression algorithm."""
+    if algorithm not in _COMPRESSION_ALGORITHMS:
+        raise ValueError(f"Unknown compression algorithm '{algorithm}'. Choose one of {_COMPRESSION_ALGORITHMS}.")
+    if algorithm == 'zlib':
+        return dict(zlib=True, complevel=complevel)
+    return dict(compression=algorithm, complevel=complevel)
+
+
+def compression_encoding(data: xr.Dataset | xr.DataArray, complevel: int = 1, algorithm: str = 'zlib') -> dict:
+    """Build an `encoding` dict for :meth:`xarray.Dataset.to_netcdf` that compresses all data variables.
+
+    Parameters
+    ----------
+    data:
+        Data to be compressed when written to disk.
+    complevel:
+        Compression level. Higher levels are considerably slower to write while rarely reducing the file size much
+        further, hence the default of 1.
+    algorithm:
+        The compression algorithm. Anything other than 'zlib' (e.g. 'zstd' or 'blosc_lz4') requires netCDF4 >= 1.6
+        with a netCDF-C library built with support for the respective filter.
+
+    Returns
+    -------
+    dict
+        Mapping of each data variable to its compression settings.
+
+    Examples
+    --------
+    >>> ds = xr.Dataset({'a': ('x', [1, 2]), 'b': ('x', [3, 4])})
+    >>> compression_encoding(ds, 4)
+    {'a': {'zlib': True, 'complevel': 4}, 'b': {'zlib': True, 'complevel': 4}}
+    >>> compression_encoding(ds['a'], algorithm='zstd')
+    {'a': {'compression': 'zstd', 'complevel': 1}}
+    >>> ds.to_netcdf("compressed.nc", encoding=compression_encoding(ds))  # doctest: +SKIP
+    """
+    settings = _compression_settings(complevel, algorithm)
+    if isinstance(data, xr.DataArray):
+        data = data.to_dataset(name=data.name if data.name is not None else '__xarray_dataarray_variable__')
+    return {variable: dict(settings) for variable in data.data_vars}
+
+
+def compress_xarray(data: xr.Dataset | xr.DataArray, complevel: int = 1,
+                    algorithm: str = 'zlib') -> xr.Dataset | xr.DataArray:
     """Compress :class:`xarray.Dataset` or :class:`xarray.DataArray`.
+
+    This returns a shallow copy of `data` (sharing the underlying arrays) with the compression set in the `encoding` of
+    each variable; the input object is left unchanged. The compression itself takes place when the data are written
+    with :meth:`~xarray.Dataset.to_netcdf`. Alternatively, pass :func:`compression_encoding` directly to
+    :meth:`~xarray.Dataset.to_netcdf`.
     
     Parameters
     ----------
     data:
         Data to compress.
     complevel:
-        Compression level.
+        Compression level (see :func:`compression_encoding`).
+    algorithm:
+        Compression algorithm (see :func:`compression_encoding`).
     
     Returns
     -------
     xr.Dataset | xr.DataArray
         Compressed data.
     """
-    compression_dict = dict(zlib=True, complevel=complevel)
     if isinstance(data, xr.Dataset):
-        for variable in data:
-            data[variable].encoding.update(compression_dict)
+        data = data.copy(deep=False)
+        for variable, encoding in compression_encoding(data, complevel, algorithm).items():
+            data[variable].encoding.update(encoding)
     elif isinstance(data, xr.DataArray):
-        data.encoding.update(compression_dict)
+        data = data.copy(deep=False)
+        data.encoding.update(_compression_settings(complevel, algorithm))
     return data
 
 
@@ -111,5 +193,6 @@ def get_dim_index(da: xr.DataArray, dim: str) -> int:
         DeprecationWarning,
         stacklevel=2
     )
-    assert isinstance(da, xr.DataArray), "First argument must be of type xr.DataArray."
-    return da.dims.index(dim)
+    if __debug__ and not isinstance(da, xr.DataArray):
+        raise TypeError("First argument must be of type xr.DataArray.")
+    return da.get_axis_num(dim)
@@ -18,42 +18,56 @@ class EnsembleAccessor(ABC):
         super().__init__()
         self._obj = data_obj
         self._key_template = None
+        self._key_elements = None
         self.member_keys = None
+        self._member_source = None   # object the cached `member_keys` were built from
 
     @property
     def key_template(self):
         """Return the key template"""
         if not self._key_template:
-            raise KeyError("key_template not set. Make sure the attributes of the "
-                           "'member' coordinate comprise a 'key_template' value. "
-                           "You can set this via ds.ens.key_template = 'your.template'.")
+            raise _missing_key_template_error()
         return self._key_template
 
     @key_template.setter
     def key_template(self, template_string):
         if '.' not in template_string: 
             raise ValueError("Elements must be divided by a dot (.).")
-        if 'member' in template_string.split('.'):
+        key_elements = tuple(template_string.split('.'))
+        if 'member' in key_elements:
             raise ValueError("key_template must not contain 'member'! "
                              "Please choose a different identifier.")
         self._key_template = template_string
+        self._key_elements = key_elements
+        self.member_keys = None
+
+    def _member_keys_cached(self, source):
+        """Check whether `member_keys` were already built from `source` (and the current key template)."""
+        return self.member_keys is not None and source is self._member_source
 
     @abstractmethod
     def _init_member_keys(self, member_values):
         self._verify_member_keys(member_values)
-        member_table = _build_member_mapping_table(member_values, self.key_template.split('.'))
+        if self._key_elements is None:
+            raise _missing_key_template_error()
+        member_table = _build_member_mapping_table(member_values, list(self._key_elements))
         self.member_keys = member_table
 
     def _verify_member_keys(self, member_values):
         def _consistent_key_pattern():
-            number_of_keys = [len(x.split('.')) for x in member_values]
-            return len(set(number_of_keys)) == 1
+            number_of_dots = (x.count('.') for x in member_values)
+            expected = next(number_of_dots, None)
+            return expected is not None and all(n == expected for n in number_of_dots)
         if not _consistent_key_pattern():
             raise ValueError("Column keys must show the same pattern. "
                              "Not all column names have the same number of keys.")
-        
-        if len(set(member_values)) != len(member_values):
-            log.warning("Member IDs are not all different!")
+
+        seen = set()
+        for x in member_values:
+            if x in seen:
+                log.warning("Member IDs are not all different!")
+                break
+            seen.add(x)
 
 
     def groupby(self, key):
@@ -73,17 +87,29 @@ def _build_member_mapping_table(member_values, member_id_elements):
 
     And `member_id_elements` would be a list like ['source_id','member_id','grid_label'].
     """
-    member_table = pd.Series(member_values).str.split('.', expand=True)
-    member_table.index = member_values
-    member_table.index.name = "member"
-    member_table.columns = member_id_elements
+    # split each name once, so that pandas receives the table as one row per member
+    member_values = list(member_values)
+    if member_values and member_values[0].count('.') + 1 != len(member_id_elements):
+        raise ValueError("The key_template does not match the structure of the member names.")
+    member_table = pd.DataFrame([value.split('.') for value in member_values],
+                                index=pd.Index(member_values, name="member"),
+                                columns=member_id_elements)
     return member_table
 
 
+def _missing_key_template_error():
+    return KeyError("key_template not set. Make sure the attributes of the "
+                    "'member' coordinate comprise a 'key_template' value. "
+                    "You can set this via ds.ens.key_template = 'your.template'.")
+
+
 @pd.api.extensions.register_dataframe_accessor("ens")
 class PandasEnsembleAccessor(EnsembleAccessor):
     def _init_member_keys(self, **kwargs):
+        if self._member_keys_cached(self._obj.columns):
+            return
         super()._init_member_keys(self._obj.columns)
+        self._member_source = self._obj.columns
 
     def groupby(self, key):
         self._init_member_keys()
@@ -100,5 +126,8 @@ class XarrayEnsembleAccessor(EnsembleAccessor):
     def _init_member_keys(self, **kwargs):
         if not 'member' in self._obj.coords:
             raise AttributeError("No coordinate 'member' found in xarray object.")
+        if self._member_keys_cached(self._obj.variables['member']):
+            return
         super()._init_member_keys(self._obj.member.values)
         self.member_keys = self.member_keys.to_xarray()
+        self._member_source = self._obj.variables['member']
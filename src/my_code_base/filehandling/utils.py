@@ -7,6 +7,8 @@
 import filecmp
 from functools import wraps
 import logging
+import os
+import stat
 import pytest
 
 
@@ -19,7 +21,8 @@ def check_input_for_duplicates(func):
 
     This decorator takes a function as input and returns a wrapped function that performs the following steps:
         1. Checks if the input is a list and contains more than one element.
-        2. Compares each pair of file paths in the list using the `os.stat` signatures (file type, size, and modification time).
+        2. Identifies duplicates by their `os.stat` signatures (file type, size, and modification time), stat-ing each file only once.
+           Files of equal size but different signatures are compared by content.
         3. Removes any duplicates from the list.
         4. Calls the original function with the cleaned-up list of file paths.
 
@@ -47,12 +50,26 @@ def check_input_for_duplicates(func):
     def wrapper(file_list):
         if not isinstance(file_list, list) or len(file_list) <= 1:
             return func(file_list)
-        remove_idx = []
-        for i, f1 in enumerate(file_list):
-            for f2 in file_list[i + 1:]:
-                res = filecmp.cmp(f1,f2, shallow=True)  # Note: shallow=False would compare the actual file contents
-                if res:
-                    remove_idx.append(i)
+        # One `os.stat` per file. Walking backwards keeps the last occurrence of each duplicate.
+        # Equal stat signatures count as duplicates, as in `filecmp.cmp(shallow=True)`. Regular files of
+        # equal size but with different signatures fall back to comparing their contents.
+        seen_signatures = set()
+        candidates_by_size = {}
+        remove_idx = set()
+        for i in range(len(file_list) - 1, -1, -1):
+            st = os.stat(file_list[i])
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            signature = (stat.S_IFMT(st.st_mode), st.st_size, st.st_mtime)
+            if signature in seen_signatures:
+                remove_idx.add(i)
+                continue
+            seen_signatures.add(signature)
+            candidates = candidates_by_size.setdefault(st.st_size, [])
+            if any(filecmp.cmp(file_list[i], other, shallow=False) for other in candidates):
+                remove_idx.add(i)
+            else:
+                candidates.append(file_list[i])
         filtered_file_list = [i for j, i in enumerate(file_list) if j not in remove_idx]
         remove_files = [i for j, i in enumerate(file_list) if j in remove_idx]
         if remove_idx:
@@ -4,7 +4,6 @@
 # Date:   2024-04-04
 # %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
 #
-from functools import singledispatch
 import logging
 import numpy as np
 import pandas as pd
@@ -13,22 +12,16 @@ import pandas as pd
 log = logging.getLogger(__name__)
 
 
-
-
-@singledispatch
 def inv(x):
-    """Invert a quadratic-shape :class:`numpy.ndarray` object."""
+    """Invert a quadratic-shape :class:`numpy.ndarray` or :class:`pandas.DataFrame` object.
+    A :class:`pandas.DataFrame` keeps its index and columns."""
+    if isinstance(x, pd.DataFrame):
+        assert np.equal(*x.shape), "Cannot invert non-quadratic object."
+        inverted = np.linalg.inv(x.to_numpy())
+        return pd.DataFrame(inverted, columns=x.columns, index=x.index)
     return np.linalg.inv(x)
 
 
-@inv.register(pd.DataFrame)
-def _(df: pd.DataFrame):
-    """Invert a quadratic-shape :class:`pandas.DataFrame` object."""
-    assert np.equal(*df.shape), "Cannot invert non-quadratic object."
-    inverted = np.linalg.inv(df)
-    return pd.DataFrame(inverted, columns=df.columns, index=df.index)
-
-
 def empirical_covariance(x, bias=False):
     """
     Compute the empirical covariance matrix of a given dataset:
@@ -75,10 +68,13 @@ def empirical_covariance(x, bias=False):
     2  180.0  450.0  450.0
     3  180.0  450.0  450.0
     """
-    X = x.T
+    X = np.asarray(x).T
     µ = X.mean(axis=0)
-    D = (X - µ)
+    D = X - µ
     dof = X.shape[0] if bias else (X.shape[0] - 1)
-    Σ = D.T.dot(D) / dof
+    Σ = D.T @ D     # numpy detects the transposed operand and uses a symmetric rank-k update (BLAS syrk)
+    Σ /= dof
+    if isinstance(x, pd.DataFrame):
+        return pd.DataFrame(Σ, index=x.index, columns=x.index)
     return Σ
 
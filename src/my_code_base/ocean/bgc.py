@@ -7,6 +7,7 @@
 import logging
 import numpy as np
 import pandas as pd
+import xarray as xr
 
 from ..core.units import pressure2atm, temperature2K
 
@@ -31,6 +32,8 @@ def temperature_correction(
     for correcting the temperature at the equilibrator :math:`T_\\text{equ}` to the SST.
 
     `CO2` can be one out of [xCO2 (mole fraction), pCO2 (partial pressure), fCO2 (fugacity)].
+    If any of the inputs is an :class:`xarray.DataArray`, the correction is evaluated via :func:`xarray.apply_ufunc`
+    and stays lazy for dask-backed data.
 
     Parameters
     ----------
@@ -49,14 +52,83 @@ def temperature_correction(
     """
     if T_out is None: T_out = kwargs.pop('T_insitu')
     if T_in is None: T_in = kwargs.pop('T_equ')
-    if method=="Takahashi2009":
-        CO2_out = CO2 * np.exp(0.0433*(T_out - T_in) - 4.35e-5*(T_out**2 - T_in**2))
-    elif method=="Takahashi1993":
-        CO2_out = CO2 * np.exp(0.0423*(T_out - T_in))
-    else:
-        raise IOError("Unknown method for temperature conversion.")
-
-    return CO2_out
+    try:
+        kernel = _TEMPERATURE_CORRECTIONS[method]
+    except KeyError:
+        raise IOError("Unknown method for temperature conversion.") from None
+
+    return _apply(kernel, CO2, T_out, T_in)
+
+
+def _apply(kernel, *args):
+    """Call the numpy `kernel` on `args`. If any of them is a :class:`xarray.DataArray`, the kernel is applied
+    block-wise via :func:`xarray.apply_ufunc`, which keeps dask-backed data lazy and fuses all operations of the kernel
+    into a single task per chunk. Attributes are taken from the first argument."""
+    if any(isinstance(a, xr.DataArray) for a in args):
+        return xr.apply_ufunc(kernel, *args, dask="parallelized", output_dtypes=[np.float64], keep_attrs=True)
+    return kernel(*args)
+
+
+def _takahashi2009(CO2, T_out, T_in):
+    values, wrap = _plain_arrays(CO2, T_out, T_in)
+    if values is None:
+        # T_out² - T_in² = (T_out - T_in)(T_out + T_in): one factored expression instead of two squares
+        return CO2 * np.exp((T_out - T_in) * (0.0433 - 4.35e-5*(T_out + T_in)))
+    CO2, T_out, T_in = values
+    buf = np.empty(np.broadcast_shapes(*(np.shape(v) for v in values)))
+    np.add(T_out, T_in, out=buf)
+    buf *= -4.35e-5
+    buf += 0.0433
+    buf *= np.subtract(T_out, T_in)
+    np.exp(buf, out=buf)
+    buf *= CO2
+    return wrap(buf)
+
+
+def _takahashi1993(CO2, T_out, T_in):
+    values, wrap = _plain_arrays(CO2, T_out, T_in)
+    if values is None:
+        return CO2 * np.exp(0.0423*(T_out - T_in))
+    CO2, T_out, T_in = values
+    buf = np.empty(np.broadcast_shapes(*(np.shape(v) for v in values)))
+    np.subtract(T_out, T_in, out=buf)
+    buf *= 0.0423
+    np.exp(buf, out=buf)
+    buf *= CO2
+    return wrap(buf)
+
+
+_TEMPERATURE_CORRECTIONS = {
+    "Takahashi2009": _takahashi2009,
+    "Takahashi1993": _takahashi1993,
+}
+
+
+def _plain_arrays(CO2, *args):
+    """Return the raw numpy values of `CO2` and `args` if they can be combined element-wise in pre-allocated buffers,
+    along with a function wrapping the result like the input (a :class:`pandas.Series` if `CO2` or any of `args` is one).
+
+    Only numpy arrays, scalars and :class:`pandas.Series` sharing the same index qualify; anything else (e.g.
+    :class:`xarray.DataArray`, which may be dask-backed, or Series that would need to be aligned) returns `(None, None)`."""
+    values, index, name = [], None, None
+    for i, x in enumerate((CO2, *args)):
+        if isinstance(x, pd.Series):
+            if index is None:
+                index = x.index
+            elif not x.index.equals(index):
+                return None, None
+            if i == 0:
+                name = x.name
+            values.append(x.to_numpy(dtype=np.float64))
+        elif isinstance(x, np.ndarray) or np.isscalar(x):
+            values.append(x)
+        else:
+            return None, None
+    if index is None and not any(isinstance(v, np.ndarray) for v in values):
+        return None, None      # only scalars: nothing to gain
+    if index is None:
+        return values, lambda result: result
+    return values, lambda result: pd.Series(result, index=index, name=name)
 
 
 def fugacity(pCO2, p_equ, SST, xCO2=None):
@@ -78,6 +150,8 @@ def fugacity(pCO2, p_equ, SST, xCO2=None):
     .. math::
        \\delta(CO_2,T) = 57.7 - 0.188\\,T
 
+    If any of the inputs is an :class:`xarray.DataArray`, the fugacity is evaluated via :func:`xarray.apply_ufunc`
+    and stays lazy for dask-backed data (the pressure unit detection of :func:`.pressure2atm` loads `p_equ`, though).
 
     Parameters
     ----------
@@ -97,8 +171,14 @@ def fugacity(pCO2, p_equ, SST, xCO2=None):
     # °C -> K
     SST = temperature2K(SST)
 
-    # respectively in cm³/mol
-    B_CO2 = -1636.75 + 12.0408*SST - 3.27957e-2*SST**2 + 3.16528e-5*SST**3
+    args = (pCO2, p_equ, SST) if xCO2 is None else (pCO2, p_equ, SST, xCO2)
+    return _apply(_fugacity, *args)
+
+
+def _fugacity(pCO2, p_equ, SST, xCO2=None):
+    """Evaluate :func:`fugacity` for pressure in atm and temperature in K."""
+    # respectively in cm³/mol; B_CO2 in Horner form
+    B_CO2 = -1636.75 + SST*(12.0408 + SST*(-3.27957e-2 + 3.16528e-5*SST))
     δ_CO2 = 57.7 - 0.118*SST
 
     # gas constant
@@ -106,12 +186,11 @@ def fugacity(pCO2, p_equ, SST, xCO2=None):
     R *= 1000                       # cm³⋅atm⋅K−1⋅mol−1
 
     if xCO2 is None:
-        x_c = 1
+        virial = B_CO2 + 2*δ_CO2    # x_c = 1
     else:
         x_c = (1 - xCO2*1e-6)       # can be (and is often) neglected in literature
+        virial = B_CO2 + 2*x_c**2*δ_CO2
 
-    A = p_equ*(B_CO2 + 2 * δ_CO2 * x_c**2)
-    B = R*SST
-    f = pCO2 * np.exp(A / B)        # same unit as pCO2 (µatm)
+    f = pCO2 * np.exp(p_equ*virial / (R*SST))        # same unit as pCO2 (µatm)
 
     return f
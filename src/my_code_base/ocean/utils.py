@@ -15,11 +15,14 @@ log = logging.getLogger(__name__)
 
 def cond2sal(C, T, p):
     """Compute salinity from conductivity, according to :cite:t:`lewis_practical_1981`.
+    Works element-wise on arrays; scalar input returns a float.
 
     Example
     -------
     >>> cond2sal(C=52, T=25, p=1013)
-    34.20810771080768
+    34.20810771080769
+    >>> cond2sal(C=np.array([52, 40]), T=np.array([25, 10]), p=1013)
+    array([34.20810771, 36.9626298 ])
     """
     p = pressure2mbar(p)/100  # convert hPa (mbar) -> dbar
     T = temperature2C(T)
@@ -56,9 +59,10 @@ def cond2sal(C, T, p):
     # TODO: check input units of Conductivity! "If you are working in conductivity units of Siemens/meter (S/m), multiply your conductivity values by 10 before using the PSS 1978 equations. "
     # TODO: maybe use units from log file for auto-conversion and print a hint or so (this could be already done during the read routine)
 
-    rT = c0 + c1*T + c2*T**2 + c3*T**3 + c4*T**4
+    # polynomials in Horner form
+    rT = c0 + T*(c1 + T*(c2 + T*(c3 + T*c4)))
 
-    alpha = (A1*p + A2*p**2 + A3*p**3)/(1 + B1*T + B2*T**2 + B3*R + B4*T*R)
+    alpha = p*(A1 + p*(A2 + p*A3))/(1 + T*(B1 + B2*T) + R*(B3 + B4*T))
 
     Rp = 1 + alpha
 
@@ -67,12 +71,19 @@ def cond2sal(C, T, p):
     k = 0.0162  # TODO: check sign! +/-?
 
     ξ = np.sqrt(RT)
-    ψ = b0 + b1*ξ + b2*ξ**2 + b3*ξ**3 + b4*ξ**4 + b5*ξ**5
-    dSal = ψ*(T - 15)/(1 + k*(T - 15))
+    ψ = b0 + ξ*(b1 + ξ*(b2 + ξ*(b3 + ξ*(b4 + ξ*b5))))
+    dT = T - 15
+    dSal = ψ*dT/(1 + k*dT)
 
-    salinity = a0 + a1*ξ + a2*ξ**2 + a3*ξ**3 + a4*ξ**4 + a5*ξ**5 + dSal
+    salinity = a0 + ξ*(a1 + ξ*(a2 + ξ*(a3 + ξ*(a4 + ξ*a5)))) + dSal
 
-    return float(salinity)
+    if np.ndim(salinity) == 0:
+        return float(salinity)
+    return salinity
+
+
+# constant term of the water vapor pressure after expanding 4.8489*ln(T/100)
+_WVP_CONST = 24.4543 + 4.8489*np.log(100)
 
 
 def water_vapor_pressure(T, S):
@@ -88,7 +99,8 @@ def water_vapor_pressure(T, S):
     """
     T = temperature2K(T)
 
-    pH2O = np.exp(24.4543 - 67.4509*(100/T) - 4.8489*np.log(T/100) - 0.000544*S)
+    # 67.4509*(100/T) = 6745.09/T; ln(T/100) = ln(T) - ln(100)
+    pH2O = np.exp(_WVP_CONST - 6745.09/T - 4.8489*np.log(T) - 0.000544*S)
     return pH2O
 
 
@@ -117,13 +129,11 @@ def ppm2uatm(xCO2, p_equ, input='wet', T=None, S=None):
     p_equ = pressure2atm(p_equ)
 
     if input == "dry":
-        pH2O = water_vapor_pressure(T, S)
+        pCO2_wet_equ = xCO2*(p_equ - water_vapor_pressure(T, S))
     elif input == "wet":
-        pH2O = 0
+        pCO2_wet_equ = xCO2*p_equ
     else:
         raise IOError("Input must be either 'dry' or 'wet'.")
 
-    pCO2_wet_equ = xCO2*(p_equ - pH2O)
-
     return pCO2_wet_equ
 
@@ -12,7 +12,10 @@ Sources:
 - https://sciviscolor.org/colormaps/
 - https://sciviscolor.org/tools/
 """
+from array import array
+import functools
 import logging
+import os
 from lxml import etree
 
 import matplotlib as mpl
@@ -34,46 +37,61 @@ def xml_to_cmap(xml):
         matplotlib.colors.LinearSegmentedColormap: The generated colormap.
 
     Raises:
-        ValueError: If the length of position is not the same as colors.
         ValueError: If position does not start with 0 and end with 1.
 
+    Colormaps read from a file path are cached as long as the file is not modified; each call returns a copy.
+
     Source: http://schubert.atmos.colostate.edu/~cslocum/custom_cmap.html
     """
+    if isinstance(xml, (str, os.PathLike)) and os.path.isfile(xml):
+        path = os.path.abspath(xml)
+        return _cached_xml_to_cmap(path, os.path.getmtime(path)).copy()
+    return _xml_to_cmap(xml)    # file-like objects, URLs, or invalid paths (raising an informative error)
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_xml_to_cmap(path, mtime):
+    """Cache for :func:`xml_to_cmap`, keyed on the modification time of the file"""
+    return _xml_to_cmap(path)
+
+
+def _xml_to_cmap(xml):
     vals = _load_xml(xml)
-    colors, position = vals["color_vals"], vals["data_vals"]
+    position = vals["x"]
 
-    if len(position) != len(colors):
-        raise ValueError("position length must be the same as colors")
-    if position[0] != 0 or position[-1] != 1:
+    if len(position) == 0 or position[0] != 0 or position[-1] != 1:
         raise ValueError("position must start with 0 and end with 1")
 
-    cdict = {color: [(pos, col, col) for pos, col in zip(position, cols)] for color, cols in zip(["red", "green", "blue"], zip(*colors))}
+    cdict = {color: np.column_stack((position, vals[channel], vals[channel]))
+             for color, channel in zip(["red", "green", "blue"], "rgb")}
 
     return mpl.colors.LinearSegmentedColormap("my_colormap", cdict, 256)
 
 
 
 def _load_xml(xml):
+    """Read the points of a ColorMoves colormap into one array per attribute: the position `x` and the channels
+    `r`, `g`, `b`."""
+    # stream over the <Point> elements and discard each one once read, instead of building the full tree first
+    buffers = {key: array('d') for key in 'xrgb'}
     try:
-        xmldoc = etree.parse(xml)
+        for _, point in etree.iterparse(xml, events=('end',), tag='Point'):
+            for key, buffer in buffers.items():
+                buffer.append(float(point.attrib[key]))
+            point.clear()
+            while point.getprevious() is not None:
+                del point.getparent()[0]
     except IOError:
         raise IOError('Invalid input file. It must be a colormap xml file. Visit' 
                       'https://sciviscolor.org/home/colormaps/ for options. '
                       'Visit https://sciviscolor.org/matlab-matplotlib-pv44/ for an example use of this script.')
 
-    points = [(float(s.attrib['x']),
-               (float(s.attrib['r']),
-                float(s.attrib['g']),
-                float(s.attrib['b'])))
-              for s in xmldoc.getroot().findall('.//Point')]
-
-    data_vals, color_vals = zip(*points)
-    return {'color_vals': color_vals, 'data_vals': data_vals}
+    return {key: np.frombuffer(buffer) for key, buffer in buffers.items()}
 
 
 def plot_cmap(colormap):
     """This is a quick example plotting the 8 by 1 gradient of the colormap"""
-    plt.imshow(np.vstack((np.linspace(0, 1, 256),) * 2), aspect='auto', cmap=plt.get_cmap(colormap))
+    plt.imshow(np.broadcast_to(np.linspace(0, 1, 256), (2, 256)), aspect='auto', cmap=plt.get_cmap(colormap))
     plt.axis('off')
     plt.tight_layout()
     plt.show()
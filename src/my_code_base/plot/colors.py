@@ -11,6 +11,12 @@ import numpy as np
 
 log = logging.getLogger(__name__)
 
+# ASCII code -> value of the hex digit; 0xFF marks invalid characters
+_HEX_LUT = np.full(256, 0xFF, dtype=np.uint8)
+_HEX_LUT[np.frombuffer(b'0123456789abcdef', dtype=np.uint8)] = np.arange(16)
+_HEX_LUT[np.frombuffer(b'ABCDEF', dtype=np.uint8)] = np.arange(10, 16)
+
+
 def hex_to_rgb(value: str) -> tuple:
     """Convert hex to rgb colors
 
@@ -30,13 +36,43 @@ def hex_to_rgb(value: str) -> tuple:
     >>> hex_to_rgb('fff')    # white
     (255, 255, 255)
     """
+    return tuple(int(v) for v in hex_to_rgb_array([value])[0])
+
+
+def hex_to_rgb_array(values: list[str]) -> np.ndarray:
+    """Convert a sequence of hex colours to rgb colors at once.
+
+    Parameters
+    ----------
+    values: list of strings
+        Hex colours of 3 or 6 characters, each optionally preceded by a hash symbol.
+
+    Returns
+    -------
+        :class:`numpy.ndarray` of shape (N, 3) and dtype uint8 with the RGB values
+
+    Examples
+    --------
+    >>> hex_to_rgb_array(['#f00', '00ff80', '#1A2b3C'])
+    array([[255,   0,   0],
+           [  0, 255, 128],
+           [ 26,  43,  60]], dtype=uint8)
+    """
+    digits = ''.join(_expand_hex(value) for value in values).encode('ascii', errors='replace')
+    nibbles = _HEX_LUT[np.frombuffer(digits, dtype=np.uint8)].reshape(-1, 3, 2)
+    if np.any(nibbles == 0xFF):
+        raise ValueError("HEX values must only contain the characters 0-9 and a-f.")
+    return (nibbles[..., 0] << 4) | nibbles[..., 1]
+
+
+def _expand_hex(value: str) -> str:
+    """Strip the hash symbol and expand 3-character hex codes to 6 characters."""
     value = value.strip("#")  # removes hash symbol if present
-    
     if len(value) == 3:
-        value = ''.join(c*2 for c in value)
-    elif len(value)!=6:
+        return ''.join(c*2 for c in value)
+    if len(value) != 6:
         raise ValueError("HEX value must be of length 3 or 6.")
-    return tuple(int(value[i:i+2], 16) for i in range(0, 6, 2))
+    return value
 
 
 def rgb_to_dec(value: list[float]) -> tuple[float]:
@@ -74,19 +110,15 @@ def build_continuous_cmap(hex_list: list[str], float_list=None, N=256, name='my_
     -------
     colour map
     """
-    rgb_list = [rgb_to_dec(hex_to_rgb(i)) for i in hex_list]
-    if float_list:
-        pass
+    rgb = hex_to_rgb_array(hex_list) / 255
+    if float_list is None or len(float_list) == 0:
+        positions = np.linspace(0, 1, len(rgb))
     else:
-        float_list = list(np.linspace(0, 1, len(rgb_list)))
-
-    cdict = dict()
-    for num, col in enumerate(['red', 'green', 'blue']):
-        col_list = [[float_list[i], 
-                     rgb_list[i][num], 
-                     rgb_list[i][num]] 
-                    for i in range(len(float_list))]
-        cdict[col] = col_list
+        positions = np.asarray(float_list, dtype=np.float64)
+
+    # one (N, 3) array of (position, value below, value above) per channel
+    cdict = {col: np.column_stack((positions, rgb[:, num], rgb[:, num]))
+             for num, col in enumerate(['red', 'green', 'blue'])}
     cmap = mcolors.LinearSegmentedColormap(name, segmentdata=cdict, N=N)
     return cmap
 
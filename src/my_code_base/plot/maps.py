@@ -17,6 +17,9 @@ from .z_overlap import fix_overlap
 
 log = logging.getLogger(__name__)
 
+# shared instance of the default CRS (constructing cartopy projections is costly); do not mutate
+_PLATE_CARREE = cartopy.crs.PlateCarree()
+
 
 def register_geoaxes_accessor(accessor_name):
     """
@@ -34,15 +37,18 @@ def register_geoaxes_accessor(accessor_name):
     >>> ax.my_accessor.some_method()
     """
     def actual_decorator(cls):
-        @functools.wraps(cls)
+        cache_name = '_' + accessor_name
+
         def accessor(geo_axes):
-            log.debug("`accessor` func")
-            if not hasattr(geo_axes, '_'+accessor_name):
+            # look up the instance dict directly; the accessor is created once per axes
+            try:
+                return geo_axes.__dict__[cache_name]
+            except KeyError:
                 log.debug("No instance of accessor found. Add as attribute.")
-                setattr(geo_axes, '_'+accessor_name, cls(geo_axes))
-            return getattr(geo_axes, '_'+accessor_name)
+                instance = geo_axes.__dict__[cache_name] = cls(geo_axes)
+                return instance
 
-        setattr(cartopy.mpl.geoaxes.GeoAxes, accessor_name, property(accessor))
+        setattr(cartopy.mpl.geoaxes.GeoAxes, accessor_name, property(accessor, doc=cls.__doc__))
 
         return cls
 
@@ -53,10 +59,13 @@ class GeoAxesAccessor(ABC):
     def __init__(self, ax):
         log.debug('Initialize accessor')
         self.geo_axes = ax
-        self._projection = self._get_cartopy_projection()
+
+    @functools.cached_property
+    def _projection(self):
+        return self._get_cartopy_projection()
 
     def _get_cartopy_projection(self):
-        return type(self.geo_axes._projection_init[1]['projection'])
+        return type(self.geo_axes.projection)
 
     def add_ocean(self, **kwargs):
         """
@@ -67,7 +76,8 @@ class GeoAxesAccessor(ABC):
         kwargs : dict
             Keyword arguments to be passed to the :meth:`~cartopy.mpl.geoaxes.GeoAxes.add_feature` method of :class:`~cartopy.mpl.geoaxes.GeoAxes`.
         """
-        log.debug('Add ocean to axis')
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug('Add ocean to axis')
         kwargs.setdefault('zorder', 0)
         self.geo_axes.add_feature(cartopy.feature.OCEAN, **kwargs)
 
@@ -80,7 +90,8 @@ class GeoAxesAccessor(ABC):
         kwargs : dict
             Keyword arguments to be passed to the :meth:`~cartopy.mpl.geoaxes.GeoAxes.add_feature` method of :class:`~cartopy.mpl.geoaxes.GeoAxes`.
         """
-        log.debug('Add land to axis')
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug('Add land to axis')
         kwargs.setdefault('zorder', 2)
         self.geo_axes.add_feature(cartopy.feature.LAND, **kwargs)
 
@@ -95,11 +106,12 @@ class GeoAxesAccessor(ABC):
         kwargs : dict
             Keyword arguments to be passed to the :meth:`~cartopy.mpl.geoaxes.GeoAxes.coastlines` method of :class:`~cartopy.mpl.geoaxes.GeoAxes`.
         """
-        log.debug('Add coastlines to axis')
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug('Add coastlines to axis')
         kwargs.setdefault('zorder', 3)
         self.geo_axes.coastlines(*args, **kwargs)
 
-    def set_extent(self, extent, crs=cartopy.crs.PlateCarree()):
+    def set_extent(self, extent, crs=_PLATE_CARREE):
         """
         Set the extent of the :class:`~cartopy.mpl.geoaxes.GeoAxes`.
 
@@ -110,7 +122,8 @@ class GeoAxesAccessor(ABC):
         crs : cartopy.crs
             The coordinate reference system in which the extent is expressed. Default is :class:`~cartopy.crs.PlateCarree`.
         """
-        log.debug('Set axis extent to %s', extent)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug('Set axis extent to %s', extent)
         self.geo_axes.set_extent(extent, crs)
 
     @abstractmethod
@@ -127,10 +140,12 @@ class StereographicAxisAccessor(GeoAxesAccessor):
     """An accessor to handle features and finishing of stereographic plots produced with `cartopy`.
     Can handle both :class:`~cartopy.crs.NorthPolarStereo` and :class:`~cartopy.crs.SouthPolarStereo` projections."""
 
+    _POLE_MAP = {cartopy.crs.SouthPolarStereo: 'south',
+                 cartopy.crs.NorthPolarStereo: 'north'}
+
     def __init__(self, ax):
         super().__init__(ax)
-        self._pole = {cartopy.crs.SouthPolarStereo: 'south',
-                      cartopy.crs.NorthPolarStereo: 'north'}[self._projection]
+        self._pole = self._POLE_MAP[self._projection]
         self._lat_limits = None
         self._lon_grid_spacing = 30
         self._draw_labels = True  # or should this rather be an attribute of self.geo_axes._draw_labels ?
@@ -193,6 +208,7 @@ class StereographicAxisAccessor(GeoAxesAccessor):
         - 'linewidth': 0.5
         - 'color': 'gray'
         - 'alpha': 0.7
+        - 'crs': :class:`~cartopy.crs.PlateCarree`
 
         The gridlines are added based on the latitude limits of the plot.
         The latitude grid spacing is set to 10 degrees.
@@ -205,6 +221,7 @@ class StereographicAxisAccessor(GeoAxesAccessor):
         kwargs.setdefault('linewidth', 0.5)
         kwargs.setdefault('color', 'gray')
         kwargs.setdefault('alpha', 0.7)
+        kwargs.setdefault('crs', _PLATE_CARREE)
 
         lat0, lat1 = self.lat_limits
         lat_grid_spacing = 10
@@ -309,12 +326,11 @@ class StereographicAxisAccessor(GeoAxesAccessor):
         self._gl.rotate_labels = False
         plt.gcf().canvas.draw()
 
-        all_label_artists = [label for label in self._gl.label_artists if label.get_text()[-1] 
+        all_label_artists = [label for label in self._gl.label_artists if label.get_text()[-1:] 
                             in ['E', 'W', '°']]
-        for label in all_label_artists:
-            alphanumeric_label = label.get_text()
-            longitude = _str2float(alphanumeric_label)
-            rot_degree = _lon2rot(longitude, self._pole)
+        longitudes = _str2float([label.get_text() for label in all_label_artists])
+        rot_degrees = _lon2rot(longitudes, self._pole)
+        for label, longitude, rot_degree in zip(all_label_artists, longitudes.tolist(), rot_degrees.tolist()):
             _rotate_and_align_label(label, longitude, rot_degree, pole=self._pole)
         return
 
@@ -337,15 +353,6 @@ def add_circular_ruler(ax, segment_length=30, offset=0, primary_color='k', secon
     width : float
         The scaled thickness of the ruler. Defaults to 1/80 of the axes' width.
     """
-    def plot_circle(degrees, radius=0.5, **kwargs):
-        """Plot a circle of given radius (based on Axis dimensions) 
-        for a list of degree segments."""
-        ax = kwargs.pop("ax", plt.gca())
-        arc_angles = np.deg2rad(degrees)
-        arc_xs = radius * np.cos(arc_angles) + 0.5
-        arc_ys = radius * np.sin(arc_angles) + 0.5
-        ax.plot(arc_xs, arc_ys, transform=ax.transAxes, solid_capstyle="butt", **kwargs)
-
     width = ax.bbox.width / 100 * width
 
     if (360 / segment_length) % 2 != 0:
@@ -354,48 +361,68 @@ def add_circular_ruler(ax, segment_length=30, offset=0, primary_color='k', secon
             "ruler can be equally distributed on a circle."
         )
 
+    bg_xs, bg_ys, seg_xs, seg_ys = _ruler_xy(segment_length, offset)
     # plot background circle (default: black, slightly broader)
-    segments_array = np.linspace(0, 360, 361, endpoint=True)
-    plot_circle(segments_array, color=primary_color, lw=width * 2 + 1, zorder=999, ax=ax)
-
+    ax.plot(bg_xs, bg_ys, transform=ax.transAxes, solid_capstyle="butt",
+            color=primary_color, lw=width * 2 + 1, zorder=999)
     # plot white circle segments on top
+    ax.plot(seg_xs, seg_ys, transform=ax.transAxes, solid_capstyle="butt",
+            color=secondary_color, lw=width * 2, zorder=1000)
+
+
+@functools.lru_cache(maxsize=16)
+def _ruler_xy(segment_length, offset):
+    """Compute the axes coordinates of the background circle and of the top segments of :func:`add_circular_ruler`.
+    The geometry only depends on `segment_length` and `offset`, hence it is cached (as read-only arrays)."""
+    def circle(degrees, radius=0.5):
+        """Points on a circle of given radius (based on Axis dimensions) for a list of degree segments."""
+        arc_angles = np.deg2rad(degrees)
+        arc_xs = np.cos(arc_angles)
+        arc_xs *= radius
+        arc_xs += 0.5
+        arc_ys = np.sin(arc_angles, out=arc_angles)
+        arc_ys *= radius
+        arc_ys += 0.5
+        arc_xs.flags.writeable = arc_ys.flags.writeable = False
+        return arc_xs, arc_ys
+
+    background = np.linspace(0, 360, 361, endpoint=True)
+
     segment_bnds_array = (
         np.arange(0, 360, segment_length).reshape((-1, 2))
         + 90  # to start at the top instead of at the right
         + offset
     )
-    segments_array = np.hstack(
-        [
-            np.hstack([np.linspace(*bnds, segment_length, endpoint=True), np.array(np.nan)])
-            for bnds in segment_bnds_array
-        ]
-    )
-    plot_circle(segments_array, color=secondary_color, lw=width * 2, zorder=1000, ax=ax)
-
-
-def _str2float(label):
-    """Turn geographic longitude grid labels into numeric values of degrees east."""
-    # Extract the numbers from the label
-    number = label.split('°')[0]
-    number = float(number)
+    # one row of `segment_length` angles per segment, each followed by a NaN to interrupt the line
+    starts, ends = segment_bnds_array[:, :1], segment_bnds_array[:, 1:]
+    segments = np.full((len(segment_bnds_array), segment_length + 1), np.nan)
+    segments[:, :-1] = starts + (ends - starts) * np.linspace(0, 1, segment_length)
+
+    return (*circle(background), *circle(segments.ravel()))
+
+
+def _str2float(labels):
+    """Turn geographic longitude grid labels into numeric values of degrees east.
+    All labels are parsed at once; returns a :class:`numpy.ndarray`."""
+    labels = np.asarray(labels, dtype=str)
+    if labels.size == 0:
+        return np.empty(labels.shape)
+    # Extract the numbers from the labels
+    numbers = np.char.partition(labels, '°')[..., 0].astype(float)
     # Turn longitudes west of the meridian into negative numbers
-    if 'W' in label:
-        number = -number
-    return number
+    west = np.char.find(labels, 'W') >= 0
+    return np.where(west, -numbers, numbers)
 
 
 def _lon2rot(lon, pole):
-    """Turn longitude value into rotation for polar stereographic plots."""
-    rot_rad = lon
-    if abs(lon) >= 90:
-        rot_rad = lon - 180
+    """Turn longitude value(s) into rotation for polar stereographic plots. Works element-wise on arrays."""
+    lon = np.asarray(lon)
+    rot_rad = np.where(np.abs(lon) >= 90, lon - 180, lon)
 
     if pole == 'south':
-        rot_rad = 0 - rot_rad
-        if np.abs(lon) == 90:
-            rot_rad -= 180
+        rot_rad = -rot_rad - 180*(np.abs(lon) == 90)
 
-    return rot_rad
+    return rot_rad[()]
 
 
 def _rotate_and_align_label(label, longitude, rot_degree, pole):
@@ -414,13 +441,19 @@ def _rotate_and_align_label(label, longitude, rot_degree, pole):
     return label
 
 
+def _circle_path(n=100, center=(0.5, 0.5), radius=0.5):
+    """Closed circle in axes coordinates."""
+    theta = np.linspace(0, 2*np.pi, n)
+    vertices = np.column_stack([np.sin(theta), np.cos(theta)])*radius + center
+    return mpath.Path(vertices, readonly=True)
+
+
+_CIRCLE_PATH = _circle_path()
+
+
 def set_circular_boundary(ax):
     """Compute a circle in axes coordinates, which we can use as a boundary for the map.
-    We can pan/zoom as much as we like – the boundary will be permanently circular."""
-    theta = np.linspace(0, 2*np.pi, 100)
-    center, radius = [0.5, 0.5], 0.5
-    vertices = np.vstack([np.sin(theta), np.cos(theta)]).T
-    circle = mpath.Path(vertices*radius + center)
-    ax.set_boundary(circle, transform=ax.transAxes)
+    We can pan/zoom as much as we like – the boundary will be permanently circular.
+    The (read-only) circle path is computed once and shared by all axes."""
+    ax.set_boundary(_CIRCLE_PATH, transform=ax.transAxes)
     return
-
@@ -5,7 +5,6 @@
 # %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
 #
 import logging
-from mpl_axes_aligner import align
 import pytest
 
 
@@ -60,22 +59,28 @@ def align_curves(ax1, y1, ax2, y2):
     >>> align_curves(ax2, y1, ax22, y3)
 
     """
+    from mpl_axes_aligner import align
+
+    # compute each reduction only once per curve
+    y1_min, y1_max, y1_mean = y1.min(), y1.max(), y1.mean()
+    y2_min, y2_max, y2_mean = y2.min(), y2.max(), y2.mean()
+
     ax1_ylim_lower, ax1_ylim_upper = ax1.get_ylim()
     ax1_extent = ax1_ylim_upper - ax1_ylim_lower
-    y1_amplitude = y1.max() - y1.min()
+    y1_amplitude = y1_max - y1_min
     y1_relative_amplitude = y1_amplitude/ax1_extent
 
-    ax1_min_offset = y1.min() - ax1_ylim_lower
+    ax1_min_offset = y1_min - ax1_ylim_lower
     ax1_min_relative_offset = ax1_min_offset/ax1_extent
 
     ax2_ylim_lower, ax2_ylim_upper = ax2.get_ylim()
-    y2_amplitude = y2.max() - y2.min()
+    y2_amplitude = y2_max - y2_min
     ax2_extent = ax2_ylim_upper - ax2_ylim_lower
 
-    ax2_new_ylim_lower = y2.min() - ax1_min_relative_offset*ax2_extent
+    ax2_new_ylim_lower = y2_min - ax1_min_relative_offset*ax2_extent
     ax2_new_ylim_upper = ax2_new_ylim_lower + y2_amplitude/y1_relative_amplitude
     ax2.set_ylim(ax2_new_ylim_lower, ax2_new_ylim_upper)
 
-    align.yaxes(ax1, y1.mean(), ax2, y2.mean())
+    align.yaxes(ax1, y1_mean, ax2, y2_mean)
 
     return
@@ -4,9 +4,12 @@
 # Date:   2024-03-04
 # %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
 #
+import functools
 import logging
 import cartopy.crs as ccrs
 import numpy as np
+import pyproj
+import xarray as xr
 
 log = logging.getLogger(__name__)
 
@@ -17,7 +20,11 @@ def fix_overlap(da, ax):
     This avoids artifacts when plotting contour lines of geographic data on a stereographic map
     projection.
 
-    Calls :func:`z_masked_overlap` to perform the data transformation.
+    Uses the same transformation as :func:`z_masked_overlap` but only computes the (boolean) mask
+    of the overlapping cells, which is then applied with :meth:`xarray.DataArray.where`.
+    The input object is not modified.
+    Data with further dimensions besides `y` and `x` (e.g. a time series of maps) are masked in one go,
+    as the mask is computed only once from the coordinates.
 
     Parameters
     ----------
@@ -25,19 +32,27 @@ def fix_overlap(da, ax):
         An :class:`xarray.DataArray` object with dimensions to be transformed.
     ax:
         A :class:`cartopy.mpl.geoaxes.GeoAxes` object with stereographic projection.
+
+    Returns
+    -------
+    xarray.DataArray
+        The data with the overlapping cells set to NaN and the projected coordinates.
     """
-    X, Y, masked_data = z_masked_overlap(ax,
-                                         da['lon'].values,
-                                         da['lat'].values,
-                                         da.squeeze().values,
-                                         source_projection=ccrs.Geodetic())
-    da.data = masked_data
+    da = da.squeeze()
+    X, Y, to_mask = _overlap_mask(ax,
+                                  da['lon'].values,
+                                  da['lat'].values,
+                                  (da.sizes['y'], da.sizes['x']),
+                                  source_projection=ccrs.Geodetic())
+    if to_mask is not None and to_mask.any():
+        # the mask only depends on the coordinates and is broadcast along any other dimension (e.g. time)
+        da = da.where(xr.DataArray(~to_mask, dims=('y', 'x')))
     da = da.assign_coords({'lon': (('y', 'x'), X),
                            'lat': (('y', 'x'), Y)})
     return da
 
 
-def z_masked_overlap(axe, X, Y, Z, source_projection=None):
+def z_masked_overlap(axe, X, Y, Z, source_projection=None, dtype=None):
     """
     .. warning::
         Normally, one should avoid calling this function.
@@ -64,6 +79,10 @@ def z_masked_overlap(axe, X, Y, Z, source_projection=None):
     source_projection : cartopy.crs.CRS, optional
         If provided and is a geodetic CRS, the data is in geodetic coordinates and should
         first be projected in the projection of the axes.
+    dtype : numpy.dtype, optional
+        If provided, the (transformed) coordinates are cast to this type before the overlap is
+        detected, e.g. `numpy.float32`, which is precise enough for the masking and halves the
+        memory traffic on large grids. The returned coordinates are of this type as well.
 
 
     X and Y are 2D arrays with the same dimensions as Z for contour and contourf operations.
@@ -74,37 +93,86 @@ def z_masked_overlap(axe, X, Y, Z, source_projection=None):
     ptx, pty, Z : list(numpy.ndarray)
         The transformed coordinates and data.
     """
+    ptx, pty, to_mask = _overlap_mask(axe, X, Y, Z.shape, source_projection=source_projection, dtype=dtype)
+
+    if to_mask is not None and np.any(to_mask):
+        Z_mask = getattr(Z, 'mask', None)
+        to_mask = to_mask if Z_mask is None else to_mask | Z_mask
+        Z = np.ma.masked_where(to_mask, Z)
+
+    return ptx, pty, Z
+
+
+def _overlap_mask(axe, X, Y, shape, source_projection=None, dtype=None):
+    """Transformed coordinates and the boolean mask of the overlapping cells for data of the given `shape`.
+    The mask is `None` if there is nothing to be masked for the given axes and coordinates
+    (see :func:`z_masked_overlap`)."""
     if not hasattr(axe, 'projection') or not isinstance(axe.projection, ccrs.Projection):
-        return X, Y, Z
+        return X, Y, None
 
     if len(X.shape) != 2 or len(Y.shape) != 2:
-        return X, Y, Z
+        return X, Y, None
 
     if source_projection is not None and isinstance(source_projection, ccrs.Geodetic):
-        transformed_pts = axe.projection.transform_points(source_projection, X, Y)
-        ptx, pty = transformed_pts[..., 0], transformed_pts[..., 1]
+        transformer = _get_transformer(source_projection, axe.projection)
+        ptx, pty = transformer.transform(np.array(X, dtype=np.float64), np.array(Y, dtype=np.float64),
+                                         inplace=True, errcheck=False)
+        # points that cannot be projected are returned as inf (cf. `CRS.transform_points`)
+        ptx[np.isinf(ptx)] = np.nan
+        pty[np.isinf(pty)] = np.nan
     else:
         ptx, pty = X, Y
 
-    with np.errstate(invalid='ignore'):
-        diagonal0_lengths = np.hypot(ptx[1:, 1:] - ptx[:-1, :-1], pty[1:, 1:] - pty[:-1, :-1])
-        diagonal1_lengths = np.hypot(ptx[1:, :-1] - ptx[:-1, 1:], pty[1:, :-1] - pty[:-1, 1:])
+    if dtype is not None:
+        ptx, pty = np.asarray(ptx, dtype=dtype), np.asarray(pty, dtype=dtype)
+
+    with np.errstate(invalid='ignore', over='ignore'):
         x_range = abs(axe.projection.x_limits[1] - axe.projection.x_limits[0])
-        to_mask = (diagonal0_lengths > x_range / 2) | np.isnan(diagonal0_lengths) | (diagonal1_lengths > x_range / 2) | np.isnan(diagonal1_lengths)
+        cells_shape = (ptx.shape[0] - 1, ptx.shape[1] - 1)
+        # contour and contourf need one extra column and row, which is allocated right away
+        # and the cells are written into the upper left view
+        extend = cells_shape[0] == shape[0] - 1 and cells_shape[1] == shape[1] - 1
+        to_mask = np.empty(shape if extend else cells_shape, dtype=bool)
+        _compute_mask(ptx, pty, x_range, to_mask[:-1, :-1] if extend else to_mask)
+
+    # TODO check if we need to do something about surrounding vertices
+
+    if extend:
+        to_mask[-1, :] = to_mask[-2, :]
+        to_mask[:, -1] = to_mask[:, -2]
 
-        # TODO check if we need to do something about surrounding vertices
+    return ptx, pty, to_mask
 
-        # add one extra colum and row for contour and contourf
-        if to_mask.shape[0] == Z.shape[0] - 1 and to_mask.shape[1] == Z.shape[1] - 1:
-            to_mask_extended = np.zeros(Z.shape, dtype=bool)
-            to_mask_extended[:-1, :-1] = to_mask
-            to_mask_extended[-1, :] = to_mask_extended[-2, :]
-            to_mask_extended[:, -1] = to_mask_extended[:, -2]
-            to_mask = to_mask_extended
 
-        if np.any(to_mask):
-            Z_mask = getattr(Z, 'mask', None)
-            to_mask = to_mask if Z_mask is None else to_mask | Z_mask
-            Z = np.ma.masked_where(to_mask, Z)
+@functools.lru_cache(maxsize=16)
+def _get_transformer(source_projection, target_projection):
+    """Cached :class:`pyproj.Transformer` between two cartopy CRS (which are :class:`pyproj.CRS` objects)."""
+    return pyproj.Transformer.from_crs(source_projection, target_projection, always_xy=True)
 
-        return ptx, pty, Z
+
+def _compute_mask(ptx, pty, x_range, out_mask, block_size=2**16):
+    """Mark the cells whose diagonals are longer than half of `x_range` (or NaN) in `out_mask`.
+
+    The grid is processed in blocks of rows of about `block_size` cells, so that the temporary
+    arrays stay small (cache-sized) instead of spanning the whole grid.
+    """
+    # compare the squared diagonal lengths against the squared threshold (saves the sqrt);
+    # `~(d <= threshold)` is also True for NaN lengths
+    threshold = (x_range / 2) ** 2
+    n_rows = out_mask.shape[0]
+    step = max(1, block_size // max(1, out_mask.shape[1]))
+    for start in range(0, n_rows, step):
+        stop = min(start + step, n_rows)
+        xs, ys = ptx[start:stop + 1], pty[start:stop + 1]
+        valid = _squared_diagonal(xs[1:, 1:] - xs[:-1, :-1], ys[1:, 1:] - ys[:-1, :-1]) <= threshold
+        valid &= _squared_diagonal(xs[1:, :-1] - xs[:-1, 1:], ys[1:, :-1] - ys[:-1, 1:]) <= threshold
+        np.logical_not(valid, out=out_mask[start:stop])
+    return out_mask
+
+
+def _squared_diagonal(dx, dy):
+    """Squared length of the cell diagonals from their coordinate differences.
+    Works in place on the (temporary) arrays `dx` and `dy`."""
+    dx *= dx
+    dx += np.square(dy, out=dy)
+    return dx
@@ -6,14 +6,18 @@
 # Date:   2024-03-03
 # %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
 #
+import functools
+import importlib.util
 import logging
+import os
 import numpy as np
 import pandas as pd
 import xarray as xr
-import xarrayutils
 
 log = logging.getLogger(__name__)
 
+_HAS_FLOX = importlib.util.find_spec('flox') is not None
+
 
 def weighted_annual_mean(ds: xr.Dataset | xr.DataArray):
     """
@@ -32,7 +36,8 @@ def weighted_annual_mean(ds: xr.Dataset | xr.DataArray):
     Raises
     ------
     AssertionError
-        If the sum of the weights in each year is not equal to 1.0.
+        If the sum of the weights in each year is not equal to 1.0 (only checked if the environment
+        variable `MCB_VALIDATE` is set to 1).
 
     Notes
     -----
@@ -46,45 +51,172 @@ def weighted_annual_mean(ds: xr.Dataset | xr.DataArray):
     The function assumes that the input dataset or data array has a 'time' dimension.
 
     """
-    def check_for_frequency(ds):
-        try:
-            estimated_frequency = xr.infer_freq(ds.time)
-            if not estimated_frequency.startswith('M'):
-                log.warning("Frequency seems to be not monthly. Consider another averaging method.")
-        except:
-            log.warning("Cannot infer frequency")
-            return
-    
-    check_for_frequency(ds)
-
-    # Determine the month length
-    month_length = ds.time.dt.days_in_month
+    _check_for_frequency(ds.time)
 
     # Calculate the weights
     # In each 4th year, the total amount of days differs compared to other years
     # Therefore, weights need to be calculated on an annual base
-    weights = month_length.groupby("time.year") / month_length.groupby("time.year").sum()
-
-    # Make sure the weights in each year add up to 1
-    assert np.allclose(weights.groupby("time.year").sum(xr.ALL_DIMS), 1.0), \
-        "The sum of the weights should be 1.0!"
-
-    # Setup our masking for nan values
-    ones = xr.where(ds.isnull(), 0.0, 1.0)
+    # (they only depend on the time axis and are cached for it)
+    weights, year = _annual_weights(ds.time)
 
     # Calculate the annual values, weighted by days in each month
-    ds_sum = (ds * weights).resample(time="YS").sum(dim="time", keep_attrs=True)
-
-    # Calculate the NaN weights
-    # This gives every NaN in the original data a weight of zero, resulting in a lower
-    # weight for affected years
-    ones_out = (ones * weights).resample(time="YS").sum(dim="time", keep_attrs=True)
-
-    # Return the weighted average
-    output = ds_sum / ones_out
-
-    output = output.assign_coords(year=('time', output.time.dt.year.values), keep_attrs=True)
-    return output.swap_dims({'time': 'year'}).drop_vars('time')
+    # The weights of NaNs in the original data are left out of the denominator, resulting in a
+    # lower weight for affected years.
+    if ds.chunks:
+        # Dask-backed data: grouped reductions keep the chunking. With `flox`, the "cohorts" method
+        # reduces each year within the (at most two) chunks it falls into instead of rechunking
+        # along the year boundaries.
+        # Numerator and denominator share one grouping by the years computed above.
+        flox_kwargs = {'method': 'cohorts'} if _HAS_FLOX and xr.get_options()['use_flox'] else {}
+        parts = xr.concat([ds * weights, ds.notnull() * weights], dim='_part')
+        parts_sum = parts.groupby(year).sum(dim="time", keep_attrs=True, **flox_kwargs)
+        output = parts_sum.isel(_part=0) / parts_sum.isel(_part=1)
+    else:
+        output = _weighted_annual_in_memory(ds, weights, year)
+
+    years = output.year.values
+    # Keep years without any time step (as NaN), as a resampling would do
+    all_years = np.arange(years[0], years[-1] + 1)
+    if years.size != all_years.size:
+        output = output.reindex(year=all_years)
+    return output
+
+
+def _weighted_annual_in_memory(ds, weights, year):
+    """Weighted annual mean of in-memory data, with numerator and denominator computed together
+    in one numpy kernel (see :func:`_weighted_annual_blocked`)."""
+    # Broadcast variables without time axis (e.g. cell areas or bounds) along `time`, as the
+    # arithmetic on the dask path does, such that they end up constant along `year`
+    if isinstance(ds, xr.Dataset):
+        static = [name for name, da in ds.data_vars.items() if 'time' not in da.dims]
+        if static:
+            ds = ds.assign({name: ds[name].broadcast_like(weights) for name in static})
+
+    # Sort by time if necessary, so that each year is a consecutive segment of the time axis
+    year_values = year.values
+    if np.any(year_values[1:] < year_values[:-1]):
+        order = np.argsort(year_values, kind='stable')
+        ds, weights, year_values = ds.isel(time=order), weights.isel(time=order), year_values[order]
+    years, starts = np.unique(year_values, return_index=True)
+
+    output = xr.apply_ufunc(_weighted_annual_blocked, ds,
+                            input_core_dims=[['time']],
+                            output_core_dims=[['year']],
+                            kwargs={'weights': weights.values, 'starts': starts},
+                            keep_attrs=True)
+    output = output.assign_coords(year=years)
+
+    # Put `year` at the former position of `time`
+    def year_first(da, dims):
+        return da.transpose(*['year' if dim == 'time' else dim for dim in dims])
+
+    if isinstance(output, xr.Dataset):
+        return output.map(lambda da: year_first(da, ds[da.name].dims), keep_attrs=True)
+    return year_first(output, ds.dims)
+
+
+def _weighted_annual_blocked(x, weights, starts, block_size=2**18):
+    """Apply :func:`_weighted_annual_kernel` to blocks of consecutive years of `x` (of about `block_size`
+    elements each), so that the temporary arrays stay small (cache-sized) instead of spanning the whole data.
+
+    `x` comes with time as its last axis (see :func:`xarray.apply_ufunc`) but is processed with time as
+    its first axis, which is the memory layout of typical `(time, ...)` data."""
+    x = np.moveaxis(x, -1, 0)
+    output = np.empty((starts.size,) + x.shape[1:])
+    bounds = np.append(starts, x.shape[0])
+    years_per_block = max(1, block_size * starts.size // max(1, x.size))
+    for i in range(0, starts.size, years_per_block):
+        j = min(i + years_per_block, starts.size)
+        t0, t1 = bounds[i], bounds[j]
+        output[i:j] = _weighted_annual_kernel(x[t0:t1], weights[t0:t1], starts[i:j] - t0)
+    return np.moveaxis(output, 0, -1)
+
+
+def _weighted_annual_kernel(x, weights, starts):
+    """Weighted means of `x` over the consecutive segments of its first axis beginning at `starts`.
+    NaNs are skipped, i.e. their weights are dropped from the denominator.
+    For single-precision (or lower) data, the denominator is accumulated in `float32`, which matches the
+    precision of the data and halves the memory traffic of this part."""
+    weights = weights.reshape((-1,) + (1,) * (x.ndim - 1))
+    valid = np.isnan(x)
+    np.logical_not(valid, out=valid)
+    numerator = _segment_sum(np.where(valid, x, 0) * weights, starts)
+    mask_weights = weights.astype(np.result_type(x.dtype, np.float32), copy=False)
+    denominator = _segment_sum(valid * mask_weights, starts)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return numerator / denominator
+
+
+def _segment_sum(a, starts):
+    """Sums over the consecutive segments of the first axis of `a` beginning at `starts`.
+    Segments of equal length (e.g. complete years of monthly data) are summed via a reshape,
+    which is considerably faster than :meth:`numpy.ufunc.reduceat`."""
+    length = a.shape[0] // starts.size
+    if length * starts.size == a.shape[0] and np.array_equal(starts, np.arange(0, a.shape[0], length)):
+        return a.reshape((starts.size, length) + a.shape[1:]).sum(axis=1)
+    return np.add.reduceat(a, starts, axis=0)
+
+
+def _check_for_frequency(time):
+    """Warn if the frequency of the time axis does not seem to be monthly.
+    For a `datetime64` time axis, the inferred frequency is cached."""
+    try:
+        if np.issubdtype(time.dtype, np.datetime64):
+            estimated_frequency = _cached_infer_freq(time.values.tobytes(), time.dtype.str)
+        else:
+            estimated_frequency = xr.infer_freq(time)
+    except (ValueError, TypeError):
+        estimated_frequency = None
+
+    if estimated_frequency is None:
+        log.warning("Cannot infer frequency")
+    elif not estimated_frequency.startswith('M'):
+        log.warning("Frequency seems to be not monthly. Consider another averaging method.")
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_infer_freq(time_bytes, dtype):
+    """Cached :func:`pandas.infer_freq` for the (hashable) raw bytes of a `datetime64` time axis."""
+    return pd.infer_freq(pd.DatetimeIndex(np.frombuffer(time_bytes, dtype=dtype)))
+
+
+def _annual_weights(time):
+    """Weights of the time steps within their year, taking the different lengths of the months into account.
+    Returns the weights and the years as :class:`xarray.DataArray` along `time`.
+    For a `datetime64` time axis, the results are cached (see :func:`_cached_annual_weights`)."""
+    if np.issubdtype(time.dtype, np.datetime64):
+        weights, year = _cached_annual_weights(time.values.tobytes(), time.dtype.str)
+    else:
+        weights, year = _compute_annual_weights(time.dt.days_in_month.values, time.dt.year.values)
+    coords = {time.name: time}
+    return (xr.DataArray(weights, dims=time.name, coords=coords),
+            xr.DataArray(year, dims=time.name, coords=coords, name='year'))
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_annual_weights(time_bytes, dtype):
+    """Cached version of :func:`_compute_annual_weights` for the (hashable) raw bytes of a `datetime64` time axis.
+    The weights are thereby computed only once per time axis."""
+    time = pd.DatetimeIndex(np.frombuffer(time_bytes, dtype=dtype))
+    return _compute_annual_weights(time.days_in_month.values, time.year.values)
+
+
+def _compute_annual_weights(month_length, year):
+    """Weights of the months within their year based on their lengths (both given as :class:`numpy.ndarray`).
+    Returns read-only arrays of the weights and the years."""
+    year = np.array(year, dtype=np.int64)
+    assert month_length.shape == year.shape, "Month lengths and years should have the same shape"
+    _, year_idx = np.unique(year, return_inverse=True)
+    days_per_year = np.bincount(year_idx, weights=month_length)
+    weights = month_length / days_per_year[year_idx]
+
+    # The weights add up to 1 in each year by construction; verify it only on request
+    if os.environ.get("MCB_VALIDATE", "0") == "1":
+        assert np.allclose(np.bincount(year_idx, weights=weights), 1.0), \
+            "The sum of the weights should be 1.0!"
+
+    weights.flags.writeable = year.flags.writeable = False
+    return weights, year
 
 
 def xr_deseasonalize(da, freq=12, dim='time'):
@@ -99,18 +231,41 @@ def xr_deseasonalize(da, freq=12, dim='time'):
     dim : str
         The name of the time dimension.
     """
-    res = xarrayutils.linear_trend(da, dim=dim)
-    time_index = xr.DataArray(np.arange(da[dim].size), dims={dim:da[dim]}, coords={dim:da[dim]})
-    trend = res.intercept + time_index*res.slope
+    da = _chunk_whole_years(da, dim, freq)
+    trend = _linear_trend(da, dim)
 
     detrended = da - trend
 
-    deseasonalized_detrended = (
-        detrended.groupby(f'{dim}.month') - detrended.groupby(f'{dim}.month').mean()
-        )
+    # subtract the monthly means mapped onto the time axis (instead of a grouped binary operation)
+    monthly_mean = detrended.groupby(f'{dim}.month').mean()
+    deseasonalized_detrended = detrended - monthly_mean.sel(month=detrended[dim].dt.month).drop_vars('month')
     return deseasonalized_detrended + trend
     
     
+def _chunk_whole_years(da, dim, freq=12):
+    """Rechunk dask-backed `da` along `dim` such that the chunks span whole years (multiples of `freq`
+    time steps), so that the grouping by month does not split chunks. In-memory data are returned as is."""
+    if da.chunks is None:
+        return da
+    chunks = da.chunks[da.get_axis_num(dim)]
+    if all(chunk % freq == 0 for chunk in chunks[:-1]):
+        return da
+    chunk_size = max(freq, round(np.median(chunks) / freq) * freq)
+    return da.chunk({dim: chunk_size})
+
+
+def _linear_trend(da, dim):
+    """Least-squares linear trend of `da` along `dim`, with the time steps 0, 1, 2, ... as x values.
+    Slope and intercept are computed in closed form; NaNs are left out of the fit."""
+    time_index = xr.DataArray(np.arange(da[dim].size, dtype=np.float64), dims=dim, coords={dim: da[dim]})
+    x = time_index.where(da.notnull())
+    x_mean, y_mean = x.mean(dim), da.mean(dim)
+    x_anomaly = x - x_mean
+    slope = (x_anomaly * (da - y_mean)).sum(dim) / (x_anomaly ** 2).sum(dim)
+    intercept = y_mean - x_mean * slope
+    return intercept + time_index * slope
+
+
 def xr_seasonal_decompose(da, dim='time'):
     """
     Perform seasonal decomposition of a time series using the given dataset.
@@ -128,14 +283,12 @@ def xr_seasonal_decompose(da, dim='time'):
         A new dataset containing the decomposed components: trend, detrended, seasonality, residuals, and deseasonalized.
     """
     assert isinstance(da, xr.DataArray), "Input should be xarray.DataArray"
-    
-    res = xarrayutils.linear_trend(da, dim=dim)
-    time_index = xr.DataArray(np.arange(da[dim].size), dims={dim:da[dim]}, coords={dim:da[dim]})
 
-    trend = res.intercept + time_index*res.slope
+    da = _chunk_whole_years(da, dim)
+    trend = _linear_trend(da, dim)
     detrended = da - trend
     seasonality = detrended.groupby(f'{dim}.month').mean()
-    residuals = detrended.groupby(f'{dim}.month') - seasonality
+    residuals = detrended - seasonality.sel(month=detrended[dim].dt.month).drop_vars('month')
     deseasonalized = residuals + trend
 
     # Create a new dataset to store the results
@@ -176,8 +329,15 @@ def pd_seasonal_decompose(x, freq=12):
     df["detrended"] = df["raw"] - df["trend"]
 
     # calculate the seasonal component
+    # (mean of each calendar month over all valid values via bincount)
     df.index = pd.to_datetime(df.index)
-    df["seasonality"] = df.groupby(df.index.month)["detrended"].transform("mean")
+    month_idx = np.asarray(df.index.month, dtype=np.intp) - 1
+    detrended = df["detrended"].to_numpy()
+    valid = ~np.isnan(detrended)
+    monthly_sums = np.bincount(month_idx[valid], weights=detrended[valid], minlength=12)
+    monthly_counts = np.bincount(month_idx[valid], minlength=12)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        df["seasonality"] = (monthly_sums / monthly_counts)[month_idx]
 
     # get the residuals
     df["residuals"] = df["detrended"] - df["seasonality"]
@@ -200,6 +360,7 @@ def extend_annual_series(ds):
     -------
     xarray.Dataset
         The extended time series dataset with monthly values.
+        The `time` dimension takes the position of the `year` dimension.
 
     Raises
     ------
@@ -208,9 +369,11 @@ def extend_annual_series(ds):
 
     Example
     -------
-    >>> ds = xr.Dataset({'time': pd.date_range('2000-01-01', '2001-12-31', freq='M'),
-    ...                  'value': np.random.rand(24)})
-    >>> extended_ds = extend_annual_series(ds)
+    >>> ds = xr.Dataset({'value': ('time', np.random.rand(24))},
+    ...                 coords={'time': pd.date_range('2000-01-01', '2001-12-31', freq='MS')})
+    >>> extended_ds = extend_annual_series(weighted_annual_mean(ds))
+    >>> extended_ds.sizes['time']
+    24
     """
     if 'year' not in ds.dims:
         ds = (ds.assign_coords(year=('time', ds.time.dt.year.values))
@@ -218,14 +381,12 @@ def extend_annual_series(ds):
 
     assert 'year' in ds.dims, 'Dataset needs to have `year` as dimension'
 
-    ds_monthly = ds.expand_dims(month=np.arange(1, 13))
-    ds_stacked = ds_monthly.stack(year_month=('year', 'month'))
-
-    _datetime = pd.to_datetime([f"{y}-{m}" for y in ds_monthly.year.values
-                                           for m in np.arange(1, 13)])
-    ds_stacked = ds_stacked.assign_coords(time=('year_month', _datetime))
-    ds_stacked = ds_stacked.swap_dims({'year_month': 'time'})
-
-    ds_stacked = ds_stacked.drop_vars(['year', 'month', 'year_month'])
-    return ds_stacked
+    # first day of each month of each year (years are counted from 1970 in `datetime64[Y]`)
+    years = (ds.year.values - 1970).astype('datetime64[Y]')
+    months = np.arange(12).astype('timedelta64[M]')
+    _datetime = (years[:, None] + months[None, :]).ravel().astype('datetime64[ns]')
 
+    # repeat every annual value 12 times along the year axis, which then becomes the time axis
+    ds_monthly = ds.isel(year=np.repeat(np.arange(ds.sizes['year']), 12))
+    ds_monthly = ds_monthly.drop_vars('year').rename({'year': 'time'}).assign_coords(time=_datetime)
+    return ds_monthly
@@ -6,7 +6,6 @@
 #
 import logging
 import xarray as xr
-from multipledispatch import dispatch
 from .timeseries import extend_annual_series, weighted_annual_mean
 
 
@@ -33,7 +32,6 @@ class StatsAccessor:
     def __init__(self, obj):
         self._obj = obj
 
-    @dispatch(str)
     def weighted_mean(self, dim):
         """
         Calculate the weighted annual mean (taking days of months into account).
@@ -48,9 +46,16 @@ class StatsAccessor:
         weighted_mean : xarray.Dataset or xarray.DataArray
             The weighted annual mean.
 
+        Raises
+        ------
+        TypeError
+            If `dim` is not a string.
+
         """
-        log.debug(f"Identified single dimension {dim}. Building weighted annual mean.")
-        return weighted_annual_mean(self._obj)
+        if isinstance(dim, str):
+            log.debug(f"Identified single dimension {dim}. Building weighted annual mean.")
+            return weighted_annual_mean(self._obj)
+        raise TypeError(f"`dim` needs to be a string, got {type(dim).__name__}.")
 
     def _is_annual(self):
         """
@@ -0,0 +1,45 @@
+# %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+# Author: Markus Ritschel
+# eMail:  git@markusritschel.de
+# Date:   2026-10-15
+# %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+#
+import logging
+import os
+import pytest
+from my_code_base.filehandling.utils import check_input_for_duplicates
+
+log = logging.getLogger(__name__)
+
+
+@check_input_for_duplicates
+def passthrough(file_list):
+    return file_list
+
+
+@pytest.fixture
+def files(tmp_path):
+    paths = {}
+    for name, content in [('a', b'abc'), ('b', b'abc'), ('c', b'abd'), ('d', b'longer content')]:
+        paths[name] = str(tmp_path / name)
+        with open(paths[name], 'wb') as f:
+            f.write(content)
+    os.utime(paths['a'], (1e9, 1e9))
+    os.utime(paths['b'], (2e9, 2e9))
+    os.utime(paths['c'], (3e9, 3e9))
+    return paths
+
+
+def test_duplicates_removed_keeping_last(files):
+    file_list = [files['a'], files['c'], files['a'], files['d'], files['b']]
+    # `a` and `b` differ in mtime but not in content; `c` has the same size as both but different content
+    assert passthrough(file_list) == [files['c'], files['d'], files['b']]
+
+
+def test_no_duplicates(files):
+    file_list = [files['a'], files['c'], files['d']]
+    assert passthrough(file_list) == file_list
+
+
+def test_non_list_input_untouched(files):
+    assert passthrough(files['a']) == files['a']
@@ -0,0 +1,72 @@
+# %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+# Author: Markus Ritschel
+# eMail:  git@markusritschel.de
+# Date:   2026-10-15
+# %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+#
+import logging
+import pytest
+import numpy as np
+import pandas as pd
+
+from my_code_base.core.pandas_utils import grid_dataframe
+from my_code_base.core.utils import centered_bins
+
+log = logging.getLogger(__name__)
+
+
+def _reference_grid(points, vals, xi):
+    """Straightforward pandas implementation of the binning used as reference."""
+    X, Y = xi
+    df = pd.DataFrame({'vals': vals, 'x': points[0], 'y': points[1]})
+    df['ix'] = pd.cut(df.x, bins=centered_bins(X), labels=False)
+    df['iy'] = pd.cut(df.y, bins=centered_bins(Y), labels=False)
+    means = df.groupby(['iy', 'ix'])['vals'].mean()
+    target = np.full((len(Y), len(X)), np.nan)
+    for (iy, ix), val in means.items():
+        target[int(iy), int(ix)] = val
+    return target
+
+
+@pytest.fixture(scope="module")
+def scattered_points():
+    rng = np.random.default_rng(42)
+    x = rng.uniform(-10, 50, 2000)
+    y = rng.uniform(30, 60, 2000)
+    vals = rng.normal(size=2000)
+    vals[::50] = np.nan
+    xi = (np.linspace(-5, 45, 40), np.linspace(35, 53, 50))
+    return (x, y), vals, xi
+
+
+def test_grid_dataframe_matches_reference(scattered_points):
+    points, vals, xi = scattered_points
+    result = grid_dataframe(points, vals, xi)
+    expected = _reference_grid(points, vals, xi)
+    assert result.shape == (len(xi[1]), len(xi[0])), "Unexpected shape of the target grid"
+    np.testing.assert_allclose(result, expected, equal_nan=True)
+
+
+def test_grid_dataframe_simple():
+    xi = (np.array([0., 1., 2.]), np.array([10., 20.]))
+    x = [0.1, -0.2, 1.9, 2.1, 5.0]
+    y = [11., 9., 19., 21., 20.]
+    vals = [1., 3., 4., 6., 100.]
+    result = grid_dataframe((x, y), vals, xi)
+    expected = np.array([[2., np.nan, np.nan],
+                         [np.nan, np.nan, 5.]])
+    np.testing.assert_allclose(result, expected, equal_nan=True)
+
+
+def test_grid_dataframe_export_grid():
+    xi = (np.array([0., 1., 2.]), np.array([10., 20.]))
+    xx, yy, target = grid_dataframe(([0.], [10.]), [1.], xi, export_grid=True)
+    assert xx.shape == yy.shape == target.shape == (2, 3), "Grid and target should share the same shape"
+    np.testing.assert_array_equal(xx[0], xi[0])
+    np.testing.assert_array_equal(yy[:, 0], xi[1])
+
+
+def test_grid_dataframe_chunked(scattered_points):
+    points, vals, xi = scattered_points
+    np.testing.assert_allclose(grid_dataframe(points, vals, xi, chunksize=333),
+                               grid_dataframe(points, vals, xi), equal_nan=True)
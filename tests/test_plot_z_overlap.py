@@ -0,0 +1,115 @@
+# %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+# Author: Markus Ritschel
+# eMail:  git@markusritschel.de
+# Date:   2026-10-15
+# %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+#
+import pytest
+import numpy as np
+import xarray as xr
+import cartopy.crs as ccrs
+from matplotlib import pyplot as plt
+from my_code_base.plot.z_overlap import fix_overlap, z_masked_overlap, _compute_mask
+
+
+@pytest.fixture(scope="module")
+def ax_robinson():
+    ax = plt.subplot(projection=ccrs.Robinson())
+    return ax
+
+
+@pytest.fixture(scope="module")
+def curvilinear_grid():
+    lon, lat = np.meshgrid(np.arange(5, 360, 10.), np.arange(-80, 90, 10.))
+    Z = np.cos(np.deg2rad(lon)) * lat
+    return lon, lat, Z
+
+
+def _reference_mask(axe, ptx, pty):
+    """Mask of the original implementation based on the diagonal lengths."""
+    diagonal0_lengths = np.hypot(ptx[1:, 1:] - ptx[:-1, :-1], pty[1:, 1:] - pty[:-1, :-1])
+    diagonal1_lengths = np.hypot(ptx[1:, :-1] - ptx[:-1, 1:], pty[1:, :-1] - pty[:-1, 1:])
+    x_range = abs(axe.projection.x_limits[1] - axe.projection.x_limits[0])
+    to_mask = ((diagonal0_lengths > x_range / 2) | np.isnan(diagonal0_lengths)
+               | (diagonal1_lengths > x_range / 2) | np.isnan(diagonal1_lengths))
+    to_mask_extended = np.zeros(ptx.shape, dtype=bool)
+    to_mask_extended[:-1, :-1] = to_mask
+    to_mask_extended[-1, :] = to_mask_extended[-2, :]
+    to_mask_extended[:, -1] = to_mask_extended[:, -2]
+    return to_mask_extended
+
+
+def test_z_masked_overlap_mask(ax_robinson, curvilinear_grid):
+    lon, lat, Z = curvilinear_grid
+    ptx, pty, masked = z_masked_overlap(ax_robinson, lon, lat, Z, source_projection=ccrs.Geodetic())
+    expected = _reference_mask(ax_robinson, ptx, pty)
+    assert expected.any(), "The test grid should contain overlapping cells"
+    np.testing.assert_array_equal(np.ma.getmaskarray(masked), expected)
+    np.testing.assert_array_equal(masked.data, Z)
+
+
+def test_z_masked_overlap_nan_coordinates(ax_robinson, curvilinear_grid):
+    lon, lat, Z = curvilinear_grid
+    lon = lon.copy()
+    lon[3, 4] = np.nan
+    ptx, pty, masked = z_masked_overlap(ax_robinson, lon, lat, Z, source_projection=ccrs.Geodetic())
+    np.testing.assert_array_equal(np.ma.getmaskarray(masked), _reference_mask(ax_robinson, ptx, pty))
+    assert masked.mask[3, 4], "Cells next to NaN coordinates should be masked"
+
+
+def test_z_masked_overlap_transform(ax_robinson, curvilinear_grid):
+    lon, lat, Z = curvilinear_grid
+    ptx, pty, _ = z_masked_overlap(ax_robinson, lon, lat, Z, source_projection=ccrs.Geodetic())
+    expected = ax_robinson.projection.transform_points(ccrs.Geodetic(), lon, lat)
+    np.testing.assert_array_equal(ptx, expected[..., 0])
+    np.testing.assert_array_equal(pty, expected[..., 1])
+
+
+def test_compute_mask_blocks():
+    rng = np.random.default_rng(0)
+    ptx, pty = rng.uniform(0, 10, (2, 50, 30))
+    ptx[7, 3] = np.nan
+    expected = _compute_mask(ptx, pty, 10., np.empty((49, 29), dtype=bool))
+    for block_size in [1, 29, 100]:
+        np.testing.assert_array_equal(_compute_mask(ptx, pty, 10., np.empty((49, 29), dtype=bool), block_size),
+                                      expected)
+
+
+def test_z_masked_overlap_cell_corners(ax_robinson, curvilinear_grid):
+    lon, lat, Z = curvilinear_grid
+    ptx, pty, masked = z_masked_overlap(ax_robinson, lon, lat, Z[:-1, :-1], source_projection=ccrs.Geodetic())
+    assert masked.shape == (lon.shape[0] - 1, lon.shape[1] - 1)
+    np.testing.assert_array_equal(np.ma.getmaskarray(masked), _reference_mask(ax_robinson, ptx, pty)[:-1, :-1])
+
+
+def test_fix_overlap(ax_robinson, curvilinear_grid):
+    lon, lat, Z = curvilinear_grid
+    da = xr.DataArray(Z, dims=('y', 'x'), coords={'lon': (('y', 'x'), lon), 'lat': (('y', 'x'), lat)})
+    original = da.copy(deep=True)
+    result = fix_overlap(da, ax_robinson)
+    ptx, pty, masked = z_masked_overlap(ax_robinson, lon, lat, Z, source_projection=ccrs.Geodetic())
+    np.testing.assert_array_equal(result.values, masked.filled(np.nan))
+    np.testing.assert_array_equal(result['lon'].values, ptx)
+    np.testing.assert_array_equal(result['lat'].values, pty)
+    xr.testing.assert_identical(da, original)
+
+
+def test_fix_overlap_multiple_time_steps(ax_robinson, curvilinear_grid):
+    lon, lat, Z = curvilinear_grid
+    data = np.stack([Z, 2 * Z, 3 * Z])
+    da = xr.DataArray(data, dims=('time', 'y', 'x'),
+                      coords={'lon': (('y', 'x'), lon), 'lat': (('y', 'x'), lat)})
+    result = fix_overlap(da, ax_robinson)
+    assert result.dims == da.dims
+    for i in range(len(da.time)):
+        xr.testing.assert_identical(result.isel(time=i), fix_overlap(da.isel(time=i), ax_robinson))
+
+
+def test_z_masked_overlap_float32(ax_robinson, curvilinear_grid):
+    lon, lat, Z = curvilinear_grid
+    ptx, pty, masked = z_masked_overlap(ax_robinson, lon, lat, Z, source_projection=ccrs.Geodetic())
+    ptx32, pty32, masked32 = z_masked_overlap(ax_robinson, lon, lat, Z, source_projection=ccrs.Geodetic(),
+                                              dtype=np.float32)
+    assert ptx32.dtype == pty32.dtype == np.float32
+    np.testing.assert_allclose(ptx32, ptx, rtol=1e-6)
+    np.testing.assert_array_equal(np.ma.getmaskarray(masked32), np.ma.getmaskarray(masked))
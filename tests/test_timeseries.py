@@ -0,0 +1,214 @@
+# %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+# Author: Markus Ritschel
+# eMail:  git@markusritschel.de
+# Date:   2026-10-15
+# %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+#
+import logging
+import pytest
+import numpy as np
+import pandas as pd
+import xarray as xr
+
+from my_code_base.stats.timeseries import (weighted_annual_mean, pd_seasonal_decompose, xr_deseasonalize,
+                                          xr_seasonal_decompose, extend_annual_series, _cached_annual_weights,
+                                          _weighted_annual_blocked, _segment_sum, _check_for_frequency,
+                                          _linear_trend)
+import my_code_base.stats.xarray_utils  # noqa: F401 (registers the `stats` accessor)
+
+log = logging.getLogger(__name__)
+
+
+def _reference_annual_mean(values, time):
+    """Straightforward loop over the years as reference for :func:`weighted_annual_mean`."""
+    time = pd.DatetimeIndex(time)
+    years = np.unique(time.year)
+    result = np.empty((len(years),) + values.shape[1:])
+    for i, year in enumerate(years):
+        in_year = time.year == year
+        weights = np.asarray(time.days_in_month[in_year], dtype=float)
+        weights /= weights.sum()
+        weights = weights.reshape((-1,) + (1,) * (values.ndim - 1))
+        x = values[in_year]
+        valid = ~np.isnan(x)
+        result[i] = np.where(valid, x * weights, 0).sum(axis=0) / np.where(valid, weights, 0).sum(axis=0)
+    return years, result
+
+
+@pytest.fixture(scope="module")
+def monthly_data():
+    time = pd.date_range('2000-03-01', '2004-12-01', freq='MS')
+    rng = np.random.default_rng(1)
+    data = rng.normal(size=(len(time), 2, 3))
+    data[5, 0, 0] = np.nan
+    data[10:22, 1, 2] = np.nan  # a full year without data
+    return xr.DataArray(data, dims=('time', 'y', 'x'), coords={'time': time, 'x': [1, 2, 3]},
+                        attrs={'units': 'K'})
+
+
+def test_weighted_annual_mean(monthly_data):
+    result = weighted_annual_mean(monthly_data)
+    years, expected = _reference_annual_mean(monthly_data.values, monthly_data.time.values)
+    assert result.dims == ('year', 'y', 'x')
+    np.testing.assert_array_equal(result.year, years)
+    np.testing.assert_allclose(result.values, expected, rtol=1e-12)
+    assert np.isnan(result.values[1, 1, 2]), "A year without any data should be NaN"
+    assert result.attrs == monthly_data.attrs
+
+
+def test_weighted_annual_mean_dataset(monthly_data):
+    ds = xr.Dataset({'a': monthly_data, 'b': 2 * monthly_data.isel(x=0)}, attrs={'title': 'test'})
+    result = weighted_annual_mean(ds)
+    xr.testing.assert_allclose(result['a'], weighted_annual_mean(monthly_data))
+    xr.testing.assert_allclose(result['b'], weighted_annual_mean(ds['b']))
+    assert result.attrs == ds.attrs
+
+
+def test_weighted_annual_mean_missing_year(monthly_data):
+    da = monthly_data.sel(time=monthly_data.time.dt.year != 2002)
+    result = weighted_annual_mean(da)
+    np.testing.assert_array_equal(result.year, np.arange(2000, 2005))
+    assert result.sel(year=2002).isnull().all()
+    xr.testing.assert_allclose(result.drop_sel(year=2002), weighted_annual_mean(monthly_data).drop_sel(year=2002))
+
+
+def test_annual_weights_cached(monthly_data):
+    _cached_annual_weights.cache_clear()
+    first = weighted_annual_mean(monthly_data)
+    second = weighted_annual_mean(monthly_data.copy(deep=True))
+    assert _cached_annual_weights.cache_info().hits == 1, "Weights of the same time axis should be reused"
+    xr.testing.assert_identical(first, second)
+
+
+def test_weighted_annual_mean_dim_order_and_sorting(monthly_data):
+    expected = weighted_annual_mean(monthly_data).transpose('y', 'year', 'x')
+    shuffled = monthly_data.isel(time=np.random.default_rng(0).permutation(monthly_data.time.size))
+    result = weighted_annual_mean(shuffled.transpose('y', 'time', 'x'))
+    assert result.dims == ('y', 'year', 'x')
+    xr.testing.assert_allclose(result, expected)
+
+
+def test_weighted_annual_mean_dask(monthly_data):
+    pytest.importorskip("dask")
+    result = weighted_annual_mean(monthly_data.chunk({'time': 7, 'x': 2}))
+    assert result.chunks is not None, "Result should stay lazy"
+    xr.testing.assert_allclose(result.compute(), weighted_annual_mean(monthly_data))
+
+
+def test_pd_seasonal_decompose():
+    time = pd.date_range('2000-01-01', periods=62, freq='MS')
+    values = np.sin(np.arange(62) / 12 * 2 * np.pi) + 0.01 * np.arange(62)
+    values += np.random.default_rng(2).normal(scale=.1, size=62)
+    result = pd_seasonal_decompose(pd.Series(values, index=time))
+    assert list(result.columns) == ['raw', 'trend', 'seasonality', 'detrended', 'residuals']
+    expected = result.groupby(result.index.month)["detrended"].transform("mean")
+    np.testing.assert_allclose(result["seasonality"], expected, rtol=1e-12, atol=1e-15)
+    np.testing.assert_allclose(result["residuals"], result["detrended"] - result["seasonality"])
+
+
+@pytest.fixture(scope="module")
+def seasonal_series():
+    time = pd.date_range('2000-01-01', periods=62, freq='MS')
+    rng = np.random.default_rng(3)
+    values = np.sin(np.arange(62) / 12 * 2 * np.pi)[:, None] + 0.01 * np.arange(62)[:, None] \
+        + rng.normal(scale=.1, size=(62, 4))
+    return xr.DataArray(values, dims=('time', 'x'), coords={'time': time})
+
+
+def test_xr_seasonal_decompose(seasonal_series):
+    result = xr_seasonal_decompose(seasonal_series)
+    assert result['seasonality'].dims == ('month', 'x')
+    expected = result['detrended'].groupby('time.month') - result['seasonality']
+    np.testing.assert_allclose(result['residuals'], expected)
+    xr.testing.assert_allclose(result['deseasonalized'], result['residuals'] + result['trend'])
+    np.testing.assert_allclose(result['residuals'].groupby('time.month').mean(), 0, atol=1e-12)
+
+
+def test_xr_deseasonalize(seasonal_series):
+    result = xr_deseasonalize(seasonal_series)
+    assert result.dims == seasonal_series.dims
+    xr.testing.assert_allclose(result, xr_seasonal_decompose(seasonal_series)['deseasonalized'])
+
+
+def test_extend_annual_series(monthly_data):
+    annual = weighted_annual_mean(monthly_data)
+    result = extend_annual_series(annual)
+    np.testing.assert_array_equal(result.time, pd.date_range('2000-01-01', '2004-12-01', freq='MS'))
+    for year in annual.year.values:
+        monthly = result.sel(time=str(year))
+        assert monthly.sizes['time'] == 12
+        expected = annual.sel(year=year, drop=True).expand_dims(time=monthly.time)
+        xr.testing.assert_allclose(monthly.transpose('time', ...), expected)
+
+
+def test_weighted_annual_mean_float32(monthly_data):
+    result = weighted_annual_mean(monthly_data.astype(np.float32))
+    expected = weighted_annual_mean(monthly_data.astype(np.float32).astype(np.float64))
+    assert result.dtype == np.float64
+    np.testing.assert_allclose(result, expected, rtol=1e-6)
+
+
+def test_weighted_annual_blocks(monthly_data):
+    x = np.moveaxis(monthly_data.values, 0, -1)
+    weights = np.random.default_rng(4).uniform(size=x.shape[-1])
+    starts = np.array([0, 10, 22, 34, 46])
+    expected = _weighted_annual_blocked(x, weights, starts, block_size=x.size)
+    for block_size in [1, 50, 200]:
+        np.testing.assert_allclose(_weighted_annual_blocked(x, weights, starts, block_size), expected, rtol=1e-12)
+
+
+def test_segment_sum():
+    a = np.random.default_rng(5).normal(size=(36, 4))
+    np.testing.assert_allclose(_segment_sum(a, np.array([0, 12, 24])), np.add.reduceat(a, [0, 12, 24], axis=0))
+    np.testing.assert_allclose(_segment_sum(a, np.array([0, 10, 24])), np.add.reduceat(a, [0, 10, 24], axis=0))
+
+
+def test_check_for_frequency(caplog):
+    monthly = xr.DataArray(pd.date_range('2000-01-01', periods=24, freq='MS'), dims='time')
+    daily = xr.DataArray(pd.date_range('2000-01-01', periods=24, freq='D'), dims='time')
+    irregular = xr.DataArray(pd.to_datetime(['2000-01-01', '2000-01-05', '2000-03-01']), dims='time')
+    with caplog.at_level(logging.WARNING):
+        _check_for_frequency(monthly)
+        assert not caplog.records
+        _check_for_frequency(daily)
+        assert "not monthly" in caplog.records[-1].message
+        _check_for_frequency(irregular)
+        assert "Cannot infer" in caplog.records[-1].message
+        _check_for_frequency(monthly[:2])
+        assert "Cannot infer" in caplog.records[-1].message
+
+
+def test_linear_trend(seasonal_series):
+    da = seasonal_series.copy()
+    da[[3, 17], 1] = np.nan
+    trend = _linear_trend(da, 'time').transpose('time', ...)
+    t = np.arange(da.time.size)
+    for i in range(da.sizes['x']):
+        y = da.values[:, i]
+        valid = ~np.isnan(y)
+        slope, intercept = np.polyfit(t[valid], y[valid], 1)
+        np.testing.assert_allclose(trend.values[:, i], intercept + slope * t, rtol=1e-10)
+
+
+def test_xr_seasonal_decompose_dask(seasonal_series):
+    pytest.importorskip("dask")
+    result = xr_seasonal_decompose(seasonal_series.chunk({'time': 10}))
+    assert all(chunk % 12 == 0 for chunk in result['residuals'].chunks[0][:-1])
+    xr.testing.assert_allclose(result.compute(), xr_seasonal_decompose(seasonal_series))
+
+
+def test_stats_accessor_weighted_mean(monthly_data):
+    xr.testing.assert_identical(monthly_data.stats.weighted_mean('time'), weighted_annual_mean(monthly_data))
+    with pytest.raises(TypeError):
+        monthly_data.stats.weighted_mean(['time'])
+
+
+def test_weighted_annual_mean_static_variables(monthly_data):
+    pytest.importorskip("dask")
+    ds = xr.Dataset({'v': monthly_data, 'area': ('x', [1., 2., np.nan], {'units': 'm2'}), 'c': 5.},
+                    coords={'x': monthly_data.x})
+    result = weighted_annual_mean(ds)
+    assert result['area'].dims == ('year', 'x')
+    np.testing.assert_allclose(result['area'], np.broadcast_to(ds['area'], (5, 3)))
+    np.testing.assert_allclose(result['c'], 5.)
+    xr.testing.assert_identical(result, weighted_annual_mean(ds.chunk()).compute())
@@ -0,0 +1,44 @@
+# %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+# Author: Markus Ritschel
+# eMail:  git@markusritschel.de
+# Date:   2026-10-15
+# %%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%%
+#
+import logging
+import pytest
+from my_code_base.core.utils import _read_git_head
+
+log = logging.getLogger(__name__)
+
+COMMIT = "0123456789abcdef0123456789abcdef01234567"
+
+
+@pytest.fixture
+def git_dir(tmp_path):
+    (tmp_path / ".git" / "refs" / "heads").mkdir(parents=True)
+    (tmp_path / "sub" / "dir").mkdir(parents=True)
+    return tmp_path
+
+
+def test_read_git_head_loose_ref(git_dir):
+    (git_dir / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+    (git_dir / ".git" / "refs" / "heads" / "main").write_text(COMMIT + "\n")
+    assert _read_git_head(git_dir / "sub" / "dir") == COMMIT
+
+
+def test_read_git_head_packed_ref(git_dir):
+    (git_dir / ".git" / "HEAD").write_text("ref: refs/heads/main\n")
+    (git_dir / ".git" / "packed-refs").write_text(f"# pack-refs with: peeled fully-peeled sorted\n"
+                                                  f"{'f' * 40} refs/heads/other\n"
+                                                  f"{COMMIT} refs/heads/main\n")
+    assert _read_git_head(git_dir) == COMMIT
+
+
+def test_read_git_head_detached(git_dir):
+    (git_dir / ".git" / "HEAD").write_text(COMMIT + "\n")
+    assert _read_git_head(git_dir) == COMMIT
+
+
+def test_read_git_head_unresolvable(git_dir):
+    (git_dir / ".git" / "HEAD").write_text("ref: refs/heads/missing\n")
+    assert _read_git_head(git_dir) is None
@@ -6,6 +6,7 @@
 #
 import logging
 import pytest
+import numpy as np
 import xarray as xr
 from my_code_base.core.xarray_utils import *
 
@@ -21,3 +22,25 @@ def test_history_accessor(fixture):
     ds = fixture
     ds.history.add("new entry")
     assert ds.attrs['history'].endswith("new entry; "), "Couldn't find the expected entry in the history"
+
+
+def test_history_accessor_buffered():
+    ds = xr.Dataset({'a': ('x', [1, 2, 3])})
+    for i in range(3):
+        ds.history.add(f"entry {i}", flush=False)
+    assert ds.attrs['history'] == "", "Buffered entries should not be written before flushing"
+    ds.history.add("")
+    assert ds.attrs['history'] == "", "Empty messages should not trigger a write"
+    assert ds.history.text.endswith("entry 2; "), "Buffered entries should be part of the history text"
+    ds.history.flush()
+    assert ds.history.text == ds.attrs['history']
+    entries = ds.attrs['history'].split("; ")[:-1]
+    assert [e.split(": ", 1)[1] for e in entries] == ["entry 0", "entry 1", "entry 2"]
+
+
+def test_compress_xarray_leaves_input_untouched():
+    ds = xr.Dataset({'a': ('x', [1., 2.]), 'b': ('x', [3., 4.])})
+    compressed = compress_xarray(ds, complevel=4)
+    assert all(compressed[v].encoding == {'zlib': True, 'complevel': 4} for v in compressed.data_vars)
+    assert all(ds[v].encoding == {} for v in ds.data_vars), "The input should not be modified"
+    assert np.shares_memory(compressed['a'].values, ds['a'].values), "Data should not be copied"